@@ -1,96 +1,28 @@
 # app.py
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
-import math
-from datetime import datetime
-from urllib.parse import urlparse, parse_qs
+import os
+from datetime import date, datetime
+
+from assets import gdrive_direct_url
+from sections import section
+from profiling import begin_rerun, current_profiler
+from watch import DataWatcher, ModuleSource, StoreSource
+# Everything that pulls in numpy, pandas, plotly or Pillow (cache, core, charts, store, timeline)
+# is imported inside the helper or section that first needs it (assets defers Pillow itself), so
+# the first paint only waits for Streamlit itself. `python benchmarks/startup.py` checks this stays true.
 
 st.set_page_config(page_title="Dhrubo Bhattacharjee — Future Skills Portfolio",
                    layout="wide",
                    initial_sidebar_state="expanded")
 
-# -------------------------
-# Helpers
-# -------------------------
-def gdrive_direct_url(share_url: str):
-    """Convert Google Drive share link to a direct download/viewable URL."""
-    if not share_url:
-        return None
-    try:
-        # typical pattern: https://drive.google.com/file/d/<id>/view?usp=sharing
-        parts = share_url.split("/")
-        if "drive.google.com" in share_url:
-            if "file" in parts and "d" in parts:
-                idx = parts.index("d")
-                file_id = parts[idx + 1]
-                return f"https://drive.google.com/uc?export=download&id={file_id}"
-            # fallback: query param id=
-            qs = parse_qs(urlparse(share_url).query)
-            if "id" in qs:
-                return f"https://drive.google.com/uc?export=download&id={qs['id'][0]}"
-    except Exception:
-        pass
-    return share_url
-
-def make_download_button(link: str, label: str = "Download Resume (PDF)"):
-    """Render a stylized top-right resume download button (opens in new tab)."""
-    if not link:
-        return
-    st.markdown(
-        f"""
-        <div style="display:flex;justify-content:flex-end;">
-          <a href="{link}" target="_blank" style="
-              background: linear-gradient(90deg,#7b2ff7,#2b86f9);
-              color: white;
-              padding: 10px 18px;
-              border-radius: 10px;
-              text-decoration: none;
-              font-weight: 600;
-              box-shadow: 0 6px 18px rgba(43,134,249,0.22);
-              ">
-            {label}
-          </a>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
-
-def predict_timeline_heuristic(skills: dict, n_projects: int, years: float):
-    """
-    Lightweight deterministic 'LLM-ish' timeline generator - offline heuristic.
-    Returns simple milestones for year 1, 3, 5.
-    """
-    ml_levels = [v["level"] for k,v in skills.items() if v.get("area") == "ML"]
-    devops_levels = [v["level"] for k,v in skills.items() if v.get("area") == "DevOps"]
-    ml_score = float(np.mean(ml_levels)) if ml_levels else 0.0
-    devops_score = float(np.mean(devops_levels)) if devops_levels else 0.0
-    elk_beginner = skills.get("Elasticsearch", {}).get("level", 0) < 40
-
-    milestones = {}
-    # Year 1
-    if years < 1:
-        milestones[1] = "Consolidate ML fundamentals, complete 1–2 production-oriented projects, document reproducible pipelines."
-    else:
-        milestones[1] = "Solidify ML fundamentals; show production-oriented notebook / dockerized demo."
-    # Year 3
-    if ml_score >= 60 and devops_score >= 40:
-        milestones[3] = "Move to ML Engineer/Data Scientist: productionized models, containerized pipelines, basic CI/CD & monitoring."
-    else:
-        milestones[3] = "Aim for ML Engineer/Data Scientist: focus on productionization, containerization, and end-to-end pipelines."
-    # Year 5
-    if devops_score >= 60 and n_projects >= 4:
-        milestones[5] = "MLOps Lead: architect ML systems, mentor teams, lead deployments and reliability."
-    else:
-        milestones[5] = "Senior ML role / path to MLOps Lead: strengthen DevOps & observability skills, lead cross-functional projects."
-    if elk_beginner:
-        milestones[3] += " (ELK is beginner — add observability and monitoring skills)."
-    return milestones
+# ?debug=profile profiles every rerun and shows the overlay; otherwise reruns are sampled
+DEBUG_PROFILE = st.query_params.get("debug") == "profile"
+PROFILER = begin_rerun(force=DEBUG_PROFILE)
 
 # -------------------------
 # Embedded data (from your provided resume & LinkedIn)
 # -------------------------
+NAME = "Dhrubo Bhattacharjee"
 HEADLINE = "ML & Data Analytics | AIML Grad | ELK (Beginner) | Building Predictive Systems"
 ABOUT_TEXT = ("AIML graduate skilled in Python, ML modeling and basic ELK configuration. "
               "I deliver reproducible ML pipelines and dashboards, and I’m focused on strengthening "
@@ -176,192 +108,315 @@ CERTIFICATIONS = [
     {"name": "Google Data Analytics Certificate", "issuer": "Google / Coursera", "date": "2023"},
 ]
 
+# Resume-based roles as date ranges (end None = ongoing); overlaps are merged by timeline.py
+EXPERIENCE = [
+    {"label": "Vodafone", "start": "2022-08-01", "end": "2022-10-31"},
+    {"label": "Aston", "start": "2023-06-01", "end": "2023-07-31"},
+    {"label": "Dassault", "start": "2024-08-01", "end": "2024-11-30"},
+    {"label": "Tanex", "start": "2025-01-01", "end": "2025-06-30"},
+    {"label": "Bristlecone", "start": "2025-08-01", "end": None}
+]
+
 # Your provided Drive links (kept as requested)
 RESUME_SHARE = "https://drive.google.com/file/d/1HGv8HNeWkTYRu4DqXRjFXntwRt52HM3E/view?usp=sharing"
 PROFILE_IMG_SHARE = "https://drive.google.com/file/d/1GcoDLu9Pm_pHfe6NOs3SGTltVT_F1qHJ/view?usp=sharing"
+PROFILE_IMG_PATH = "assets/images/profile.png"  # local copy of the profile image, preferred over the link
+
+# Multi-profile deployments: with PORTFOLIO_STORE pointing at a store.py directory,
+# ?profile=<id> lazily loads just that profile's rows instead of the embedded data above.
+STORE_ROOT = os.environ.get("PORTFOLIO_STORE")
+PROFILE_ID = st.query_params.get("profile")
+
+# The page's data is read from this file's literals above (PORTFOLIO_DATA=data.py for another data
+# module) or from the store. The watcher reloads it when those files change and keeps every cached
+# artifact that does not depend on the changed entries, so edits need no process restart.
+DATA_MODULE = os.environ.get("PORTFOLIO_DATA", os.path.abspath(__file__))
+SOURCE = StoreSource(STORE_ROOT, PROFILE_ID) if STORE_ROOT and PROFILE_ID else ModuleSource(DATA_MODULE)
+
+@st.cache_resource
+def data_watcher():
+    """One DataWatcher for the process; sources are bounded, so memory does not grow with profiles viewed."""
+    return DataWatcher()
+
+try:
+    MODEL = data_watcher().current(SOURCE)
+except KeyError:
+    st.error(f"Unknown profile: {PROFILE_ID}")
+    st.stop()
+except Exception as exc:  # a malformed data file on first load; later bad edits keep the last good data
+    st.error(f"Profile data could not be loaded: {exc}")
+    st.stop()
+if isinstance(SOURCE, StoreSource):
+    PROFILE_IMG_PATH = ""
+
+# From here on the page reads the shared model; this run's literals above are released
+# once rebound, so a session keeps only its widget state and references into MODEL.
+NAME, HEADLINE, ABOUT_TEXT, CONTACT = MODEL.name, MODEL.headline, MODEL.about, MODEL.contact
+SKILLS, PROJECTS, CERTIFICATIONS, EXPERIENCE = MODEL.skills, MODEL.projects, MODEL.certifications, MODEL.experience
+RESUME_SHARE, PROFILE_IMG_SHARE = MODEL.resume_link, MODEL.image_link
+
+def portfolio_cache():
+    """
+    The PortfolioCache of this run's MODEL, built on first use so numpy loads after the profile column
+    renders. Fragment reruns keep the MODEL of the last full run, so the cache is looked up by that
+    model's version rather than taken from whatever version another session's reload installed.
+    """
+    return data_watcher().cache(SOURCE, MODEL)
 
 RESUME_LINK = gdrive_direct_url(RESUME_SHARE)
 PROFILE_IMG = gdrive_direct_url(PROFILE_IMG_SHARE)
+# Serve thumbnails from `python assets.py serve` (or a CDN in front of it) instead of through the app
+ASSET_BASE_URL = os.environ.get("PORTFOLIO_ASSET_BASE_URL", "").rstrip("/")
+
+@st.cache_resource(max_entries=8)
+def page_fragments(version: str, _model, resume_link: str):
+    """Escaped HTML of the about box, resume button, project cards and certifications, once per data version."""
+    from fragments import PageFragments
+    return PageFragments(_model.about, resume_link, _model.projects, _model.certifications)
+
+def profile_image_source() -> str:
+    """Local profile image if present, otherwise the share link fetched through the asset disk cache."""
+    if PROFILE_IMG_PATH and os.path.exists(PROFILE_IMG_PATH):
+        return PROFILE_IMG_PATH
+    from assets import resolve_remote
+    return resolve_remote(PROFILE_IMG)
+
+def experience_history():
+    """Cumulative experience series up to today, cached per data version and day."""
+    from timeline import experience_series
+    return portfolio_cache().get("experience", (str(date.today()),), lambda: experience_series(EXPERIENCE))
+
+def timeline_points(years: float):
+    """(xs, ys) of the experience history and (xs, ys) of its projection to `years` total experience."""
+    from timeline import project_forward
+    hist = experience_history()
+    proj = project_forward(hist, float(years))
+    points = lambda s: (s.index.strftime("%Y-%m-%d").tolist(), s.round(3).tolist())
+    return points(hist), points(proj)
+
+def timeline_chart(years: float) -> dict:
+    from charts import THEME, timeline_figure
+    (xs, ys), (px, py) = timeline_points(years)
+    return timeline_figure(xs, ys, px, py, THEME)
+
+def animated_timeline() -> dict:
+    from charts import THEME, animated_timeline_figure
+    grid = portfolio_cache().grid
+    xs, ys = timeline_points(0.0)[0]
+    return animated_timeline_figure(xs, ys, [timeline_points(y)[1] for y in grid.years], grid.years, THEME)
+
+def skill_forecast(years: float):
+    """Monte Carlo percentile bands of every skill at the slider year, per (data version, year, seed)."""
+    from forecast import SAMPLES, SEED, Forecast
+    cache = portfolio_cache()
+    # workers=0: never start a process pool from inside the server's session threads
+    return cache.get("forecast", ((years,), SEED, SAMPLES), lambda: Forecast(cache.grid.matrix, [years], workers=0))
+
+def fan_forecast():
+    """Average-level bands over whole slider years, shared by every slider position."""
+    from forecast import FAN_SAMPLES, SEED, Forecast
+    cache = portfolio_cache()
+    grid = tuple(float(y) for y in cache.grid.years if float(y).is_integer())
+    return cache.get("forecast", (grid, SEED, FAN_SAMPLES),
+                     lambda: Forecast(cache.grid.matrix, grid, samples=FAN_SAMPLES, skill_bands=False, workers=0))
 
 # -------------------------
-# Page layout: left column for profile + controls; right for content
+# Page sections (see sections.py for widget dependencies)
 # -------------------------
-left_col, main_col = st.columns([1, 3])
-
-with left_col:
-    # Profile photo, headline, contact, experience slider
+@section("profile")
+def render_profile():
+    # Profile photo, headline, contact
     if PROFILE_IMG:
         try:
-            st.image("assets/images/profile.png", width=180)
+            # 2x the display width for high-DPI screens; still a fraction of the original PNG
+            from assets import variant
+            thumb = variant(profile_image_source(), 360)
+            if ASSET_BASE_URL:
+                st.markdown(f'<img src="{ASSET_BASE_URL}/{os.path.basename(thumb)}" width="180">', unsafe_allow_html=True)
+            else:
+                st.image(thumb, width=180)
         except Exception:
             st.info("Profile image couldn't be loaded from link. Use PNG/JPG under 2MB (~400x400 recommended).")
     else:
         st.info("Add profile image link in the code.")
 
-    st.markdown(f"### <span style='color:#cfcfff'>{'Dhrubo Bhattacharjee'}</span>", unsafe_allow_html=True)
+    st.markdown(f"### <span style='color:#cfcfff'>{NAME}</span>", unsafe_allow_html=True)
     st.markdown(f"**{HEADLINE}**")
-    # Transparent box for about text
-    st.markdown(
-        f"""
-        <div style="
-            background: rgba(255,255,255,0.03);
-            border: 1px solid rgba(255,255,255,0.04);
-            padding: 10px;
-            border-radius: 8px;
-        ">
-            <p style="color:#d7dff9;margin:0;">{ABOUT_TEXT}</p>
-        </div>
-        """, unsafe_allow_html=True
-    )
-    st.markdown("---")
-    # Experience slider (1 - 10 years)
-    years = st.slider("Total professional experience (years)", min_value=1.0, max_value=10.0, value=1.0, step=0.25)
-    st.markdown(f"**Selected experience:** {years} yrs")
-
+    # Transparent box for about text (pre-rendered, see fragments.py)
+    fragments = page_fragments(MODEL.version, MODEL, RESUME_LINK)
+    st.markdown(fragments.about, unsafe_allow_html=True)
     st.markdown("---")
     # Contact quick list and resume button
-    st.write(f"**Email:** {CONTACT['email']}")
-    st.write(f"**GitHub:** {CONTACT['github']}")
-    st.write(f"**LinkedIn:** {CONTACT['linkedin']}")
-    st.write(f"**Mobile:** {CONTACT['phone']}")
-    make_download_button(RESUME_LINK, label="Download Resume (PDF)")
+    st.write(f"**Email:** {CONTACT.get('email', '')}")
+    st.write(f"**GitHub:** {CONTACT.get('github', '')}")
+    st.write(f"**LinkedIn:** {CONTACT.get('linkedin', '')}")
+    st.write(f"**Mobile:** {CONTACT.get('phone', '')}")
+    if fragments.resume:
+        st.markdown(fragments.resume, unsafe_allow_html=True)
 
-with main_col:
+@section("kpis")
+def render_kpis():
     # Top KPIs and short chart area (left side removed pie chart)
     k1, k2, k3 = st.columns([1,1,1])
     k1.metric("Role", "Associate Data Scientist → Ready for ML Engineer")
     k2.metric("Projects", len(PROJECTS))
     k3.metric("Certifications", len(CERTIFICATIONS))
 
-    st.markdown("---")
-
-    # Skill Projection (bar + radar) using selected years
-    st.header("Skill Projection")
-    proj_rows = []
-    for name, meta in SKILLS.items():
-        base = meta["level"]
-        # heuristic target & speed
-        if meta.get("area") == "ML":
-            target = min(100, base + 30)
-            k = 0.6
-        elif meta.get("area") == "DevOps":
-            target = min(100, base + 40)
-            k = 0.5
-        else:
-            target = min(100, base + 20)
-            k = 0.45
-        predicted = base + (target - base) * (1 - math.exp(-k * years))
-        proj_rows.append({"skill": name, "current": base, "predicted": round(predicted, 1), "area": meta.get("area")})
-    proj_df = pd.DataFrame(proj_rows).sort_values("predicted", ascending=False)
+@section("skill_charts")
+def render_skill_charts(years: float, animate: bool, forecast: bool):
+    from charts import (THEME, animated_bar_figure, animated_radar_figure, bar_figure, forecast_bar_figure,
+                        forecast_fan_figure, radar_figure)
+    cache = portfolio_cache()
+    top_n_max = len(SKILLS)
 
     col_a, col_b = st.columns([2,3])
     with col_a:
         st.subheader("Top Skills (predicted)")
-        top_n = st.slider("Top N skills to show", min_value=3, max_value=len(proj_df), value=6, key="topn")
-        top_df = proj_df.head(int(top_n))
-        fig_bar = go.Figure()
-        fig_bar.add_trace(go.Bar(x=top_df["skill"], y=top_df["current"], name="Current"))
-        fig_bar.add_trace(go.Bar(x=top_df["skill"], y=top_df["predicted"], name=f"Predicted @ {years} yrs"))
-        fig_bar.update_layout(barmode='group', yaxis=dict(range=[0,100]), template="plotly_dark", margin=dict(t=20,b=10))
+        top_n = st.slider("Top N skills to show", min_value=3, max_value=top_n_max, value=6, key="topn")
+        top_skills, top_cur, top_pred = cache.grid.top(years, top_n)
+        if forecast:
+            fig_bar = cache.get("bar_forecast", (years, int(top_n), THEME), lambda: forecast_bar_figure(
+                top_skills, top_cur, skill_forecast(years).at(years)[:, cache.grid.top_index(years, top_n)], years, THEME))
+        elif animate:
+            fig_bar = cache.get("bar_anim", (int(top_n), THEME), lambda: animated_bar_figure(cache.grid, top_n, THEME))
+        else:
+            fig_bar = cache.get("bar", (years, int(top_n), THEME),
+                                lambda: bar_figure(top_skills, top_cur, top_pred, years, THEME))
         st.plotly_chart(fig_bar, use_container_width=True)
     with col_b:
         st.subheader("Detailed Skill Radar")
-        cats = top_df["skill"].tolist()
-        vals_cur = top_df["current"].tolist()
-        vals_pred = top_df["predicted"].tolist()
-        if len(cats) >= 3:
-            cats_loop = cats + [cats[0]]
-            vals_cur_loop = vals_cur + [vals_cur[0]]
-            vals_pred_loop = vals_pred + [vals_pred[0]]
-            fig = go.Figure()
-            fig.add_trace(go.Scatterpolar(r=vals_cur_loop, theta=cats_loop, fill='toself', name='Current'))
-            fig.add_trace(go.Scatterpolar(r=vals_pred_loop, theta=cats_loop, fill='toself', name=f'Predicted @ {years} yrs'))
-            fig.update_layout(polar=dict(radialaxis=dict(visible=True, range=[0,100])), template="plotly_dark", margin=dict(t=10,b=10))
+        if len(top_skills) >= 3:
+            if animate:
+                fig = cache.get("radar_anim", (int(top_n), THEME), lambda: animated_radar_figure(cache.grid, top_n, THEME))
+            else:
+                fig = cache.get("radar", (years, int(top_n), THEME),
+                                lambda: radar_figure(top_skills, top_cur, top_pred, years, THEME))
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("Select at least 3 top skills to render radar chart.")
+    if forecast:
+        from forecast import FAN_SAMPLES, SAMPLES, SEED
+        st.subheader("Forecast range (average skill level)")
+        fan = fan_forecast()
+        fig = cache.get("fan_forecast", (years, THEME),
+                        lambda: forecast_fan_figure(fan.years, fan.mean_bands, years, THEME))
+        st.plotly_chart(fig, use_container_width=True)
+        st.caption(f"Bars show the median of {SAMPLES:,} sampled growth curves per skill with P10–P90 whiskers; "
+                   f"the band uses {FAN_SAMPLES:,} samples (seed {SEED}).")
+
+@section("growth")
+def render_growth():
+    # Experience slider (1 - 10 years); only this section and the nested skill charts rerun when it moves
+    years = st.slider("Total professional experience (years)", min_value=1.0, max_value=10.0, value=1.0, step=0.25, key="years")
+    st.markdown(f"**Selected experience:** {years} yrs")
+    animate = st.toggle("Animate charts in the browser", key="animate",
+                        help="Ship every slider step once as chart frames and scrub through years without a server round-trip. "
+                             "`python benchmarks/payload.py` reports when this pays off.")
+    forecast = st.toggle("Forecast ranges (Monte Carlo)", key="forecast",
+                         help="Sample each skill's growth speed, shape and ceiling and show P10/P50/P90 instead of one curve.")
 
     st.markdown("---")
 
-    # Projects: boxed cards + expanded details
-    st.header("Selected Projects")
-    for proj in PROJECTS:
-        st.markdown(
-            f"""
-            <div style="
-                background: linear-gradient(135deg, rgba(43,134,249,0.04), rgba(123,47,247,0.03));
-                border: 1px solid rgba(255,255,255,0.03);
-                padding:12px;
-                border-radius:10px;
-                margin-bottom:10px;
-            ">
-                <div style="display:flex;justify-content:space-between;align-items:center;">
-                    <div style="font-weight:700;color:#e6e6ff;padding:8px 12px;border-radius:8px;background:rgba(0,0,0,0.18);">
-                        {proj['title']}
-                    </div>
-                    <div style="color:#aab6ff;font-size:13px;">Tech: {', '.join(proj.get('tech',[]))}</div>
-                </div>
-                <div style="margin-top:8px;color:#d7dff9;">{proj['short_description']}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        with st.expander("Read more / Details"):
-            st.write(proj["long_description"])
-            st.markdown(f"[Repository]({proj['link']})")
+    # Skill Projection (bar + radar) using selected years
+    st.header("Skill Projection")
+    render_skill_charts(years, animate, forecast)
 
     st.markdown("---")
 
+    from charts import THEME
+    cache = portfolio_cache()
+
     # Experience Growth (Cumulative timeline) - updates with slider
-    st.header("Experience Growth (Cumulative timeline)")
-    # Resume-based approximate durations (as previously estimated)
-    milestones = [
-        {"label": "Vodafone (end Oct 2022)", "exp": 0.25, "date": "2022-10"},
-        {"label": "Aston (end Jul 2023)", "exp": 0.17, "date": "2023-07"},
-        {"label": "Dassault (end Nov 2024)", "exp": 0.33, "date": "2024-11"},
-        {"label": "Tanex (end Jun 2025)", "exp": 0.50, "date": "2025-06"},
-        {"label": "Bristlecone (start Aug 2025)", "exp": 0.28, "date": "2025-11"}
-    ]
-    # Build cumulative y-values and include the selected slider years as last point (to simulate future)
-    cum = 0.0
-    xs = []
-    ys = []
-    labels = []
-    for m in milestones:
-        cum += m["exp"]
-        xs.append(m["date"])
-        ys.append(round(cum, 3))
-        labels.append(m["label"])
-    # Add slider-selected projection point: set final point to max(cum, years)
-    xs.append("Selected")
-    ys.append(round(max(cum, years), 3))
-    labels.append(f"Selected {years} yrs (slider)")
-
-    fig_line = go.Figure()
-    fig_line.add_trace(go.Scatter(x=xs, y=ys, mode="lines+markers", name="Cumulative experience (years)"))
-    fig_line.update_layout(template="plotly_dark", yaxis=dict(title="Years (cumulative)"), margin=dict(t=10,b=10))
-    st.plotly_chart(fig_line, use_container_width=True)
-
-    st.markdown("**Notes:** Cumulative experience is estimated using listed internships and current role. Move the slider (1–10 yrs) to simulate projected cumulative experience.")
+    with current_profiler().section("experience_growth"):
+        st.header("Experience Growth (Cumulative timeline)")
+        if animate:
+            fig_line = cache.get("timeline_anim", (str(date.today()), THEME), animated_timeline)
+        else:
+            fig_line = cache.get("timeline", (years, str(date.today()), THEME), lambda: timeline_chart(years))
+        st.plotly_chart(fig_line, use_container_width=True)
+
+        st.markdown("**Notes:** Cumulative experience is computed from the listed internships and current role (overlapping roles count once). Move the slider (1–10 yrs) to simulate projected cumulative experience (dashed).")
 
     st.markdown("---")
 
     # Predicted Timeline (heuristic LLM-like)
-    st.header("Predicted Timeline (heuristic)")
-    milestones_pred = predict_timeline_heuristic(SKILLS, len(PROJECTS), years)
-    st.markdown(f"**Based on:** {len(SKILLS)} skills, {len(PROJECTS)} projects, and {years} yrs experience.")
-    for yr in sorted(milestones_pred.keys()):
-        st.markdown(f"**Year {yr}:** {milestones_pred[yr]}")
+    with current_profiler().section("predicted_timeline"):
+        st.header("Predicted Timeline (heuristic)")
+        from core import predict_timeline_heuristic
+        from rules import default_engine
+        # keyed by the rule table's hash too: an edited timeline_rules.json takes effect on the next rerun
+        engine = default_engine()
+        milestones_pred = cache.get("milestones", (years, engine.version),
+                                    lambda: predict_timeline_heuristic(SKILLS, len(PROJECTS), years, engine))
+        st.markdown(f"**Based on:** {len(SKILLS)} skills, {len(PROJECTS)} projects, and {years} yrs experience.")
+        for yr in sorted(milestones_pred.keys()):
+            st.markdown(f"**Year {yr}:** {milestones_pred[yr]}")
 
-    st.markdown("---")
+@section("projects")
+def render_projects():
+    # Projects: searchable, paginated boxed cards; details render only once their expander is opened
+    from search import ProjectIndex, page
+    cache = portfolio_cache()
+    st.header("Selected Projects")
+    index = cache.get("project_index", (), lambda: ProjectIndex(PROJECTS))
+    reset_page = lambda: st.session_state.update(project_page=1)
+    q_col, t_col = st.columns([3, 2])
+    query = q_col.text_input("Search projects", key="project_query", on_change=reset_page,
+                             placeholder="e.g. sentiment, pytorch")
+    techs = t_col.multiselect("Technology", index.techs, key="project_tech", on_change=reset_page)
+    # not cached: a query only touches its own postings, and visitors' free text would evict shared figures
+    hits = index.search(query, techs)
+    if not hits:
+        st.info("No projects match the search.")
+        return
+    visible, pages = page(hits, st.session_state.get("project_page", 1))
+    cards = page_fragments(MODEL.version, MODEL, RESUME_LINK).projects
+    for pos in visible:
+        proj = PROJECTS[pos]
+        st.markdown(cards[pos], unsafe_allow_html=True)
+        details = st.expander("Read more / Details", key=f"project_open_{pos}", on_change="rerun")
+        if details.open:
+            with details:
+                st.write(proj["long_description"])
+                st.markdown(f"[Repository]({proj['link']})")
+    if pages > 1:
+        st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, key="project_page")
+    st.caption(f"{len(hits)} of {len(PROJECTS)} projects")
 
+@section("certifications")
+def render_certifications():
     # Certifications below experience
     st.header("Certifications")
-    cols = st.columns(3)
-    for i, cert in enumerate(CERTIFICATIONS):
-        with cols[i % 3]:
-            st.markdown(f"**{cert['name']}**")
-            if cert.get("issuer"):
-                st.write(cert.get("issuer"))
-            st.caption(cert.get("date",""))
+    st.markdown(page_fragments(MODEL.version, MODEL, RESUME_LINK).certifications, unsafe_allow_html=True)
+
+# -------------------------
+# Page layout: left column for profile; right for content
+# -------------------------
+left_col, main_col = st.columns([1, 3])
 
+with left_col:
+    render_profile()
+
+with main_col:
+    render_kpis()
+    st.markdown("---")
+    render_growth()
+    st.markdown("---")
+    render_projects()
+    st.markdown("---")
+    render_certifications()
     st.markdown("---")
     st.caption("Design: Dark futuristic — replace profile image and resume links with direct links if you prefer. This is a lightweight prototype; we can expand with a small API or real LLM later if desired.")
+
+# Rerun profile: written to the JSONL log when sampled, shown in an overlay with ?debug=profile
+PROFILE_RECORD = PROFILER.finish()
+if DEBUG_PROFILE and PROFILE_RECORD:
+    with main_col.expander("Rerun profile (debug)", expanded=True):
+        st.caption(f"Full page run: {PROFILE_RECORD['total_ms']:.1f} ms (fragment reruns are logged separately)")
+        st.dataframe([{"section": name, **stats} for name, stats in PROFILE_RECORD["sections"].items()],
+                     use_container_width=True)
+        from fragments import RENDERER
+        frag = RENDERER.stats()
+        st.caption(f"HTML fragment cache: {frag['hits']} hits, {frag['misses']} misses, {frag['size']} entries")
+        if data_watcher().events:
+            st.caption(f"Last data reload: {data_watcher().events[-1]}")
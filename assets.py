@@ -0,0 +1,197 @@
+# assets.py
+# Image asset pipeline. Source images are resized and re-encoded (WebP or
+# optimized PNG) once per target width and persisted under a cache directory,
+# keyed by the source's content hash, so the page ships a small thumbnail
+# instead of the full-size original. Remote share links are fetched through
+# the same disk cache; a fixture directory can stand in for the network.
+#
+#   python assets.py build assets/images/profile.png --width 360
+#   python assets.py serve --port 8600
+
+import argparse
+import hashlib
+import http.server
+import os
+import shutil
+import tempfile
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from urllib.parse import parse_qs, urlparse
+
+CACHE_DIR = os.environ.get("PORTFOLIO_ASSET_CACHE", os.path.join("assets", ".cache"))
+FIXTURES_DIR = os.environ.get("PORTFOLIO_ASSET_FIXTURES")
+FORMATS = {"webp": ("WEBP", {"quality": 82, "method": 6}), "png": ("PNG", {"optimize": True})}
+CACHE_HEADERS = {"Cache-Control": "public, max-age=31536000, immutable"}
+RETRY_AFTER = 300.0  # seconds before a failed remote fetch is tried again
+
+_hash_memo = {}
+_failures = {}  # url -> (monotonic time it may be retried, exception)
+_failures_lock = threading.Lock()
+
+
+def content_hash(path: str) -> str:
+    """SHA-1 of a file's bytes, memoized on (path, size, mtime) so reruns don't rehash."""
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+    if key not in _hash_memo:
+        h = hashlib.sha1()
+        with open(path, "rb") as fh:
+            for block in iter(lambda: fh.read(1 << 16), b""):
+                h.update(block)
+        _hash_memo[key] = h.hexdigest()
+    return _hash_memo[key]
+
+
+def gdrive_direct_url(share_url: str):
+    """Convert Google Drive share link to a direct download/viewable URL."""
+    if not share_url:
+        return None
+    try:
+        # typical pattern: https://drive.google.com/file/d/<id>/view?usp=sharing
+        parts = share_url.split("/")
+        if "drive.google.com" in share_url:
+            if "file" in parts and "d" in parts:
+                idx = parts.index("d")
+                file_id = parts[idx + 1]
+                return f"https://drive.google.com/uc?export=download&id={file_id}"
+            # fallback: query param id=
+            qs = parse_qs(urlparse(share_url).query)
+            if "id" in qs:
+                return f"https://drive.google.com/uc?export=download&id={qs['id'][0]}"
+    except Exception:
+        pass
+    return share_url
+
+
+@contextmanager
+def _atomic_path(path: str):
+    """Yield a private temporary path next to `path` and publish it there atomically if the block succeeds."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".", suffix=".tmp")
+    os.close(fd)
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def variant(src: str, width: int, fmt: str = "webp", cache_dir: str = CACHE_DIR) -> str:
+    """
+    Path of `src` resized to at most `width` px wide and re-encoded as `fmt`,
+    generating and persisting it on first use. The file name embeds the source
+    hash, so a changed source gets a new name and stale variants are never served.
+    """
+    pil_format, options = FORMATS[fmt]
+    out_dir = os.path.join(cache_dir, "variants")
+    out = os.path.join(out_dir, f"{content_hash(src)[:16]}-{int(width)}.{fmt}")
+    if os.path.exists(out):
+        return out
+    from PIL import Image  # only needed on a cache miss
+
+    os.makedirs(out_dir, exist_ok=True)
+    with Image.open(src) as img:
+        img = img.convert("RGBA" if img.mode in ("RGBA", "LA", "P") else "RGB")
+        if img.width > width:
+            img = img.resize((int(width), max(1, round(img.height * width / img.width))), Image.LANCZOS)
+        # each writer has its own temp file, so concurrent sessions never publish a mixed or half-written file
+        with _atomic_path(out) as tmp:
+            img.save(tmp, pil_format, **options)
+    return out
+
+
+def _is_html(path: str) -> bool:
+    with open(path, "rb") as fh:
+        return fh.read(512).lstrip()[:1] == b"<"
+
+
+def resolve_remote(url: str, cache_dir: str = CACHE_DIR, fixtures_dir=FIXTURES_DIR, timeout: float = 10.0) -> str:
+    """
+    Local path for a remote image URL, downloading it into the disk cache once.
+    Only image responses are persisted (a share link's HTML interstitial is
+    not an image); a failed fetch is remembered for RETRY_AFTER seconds and
+    re-raised without touching the network. With a fixtures directory, files
+    named like the cache entries are used instead.
+    """
+    name = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+    if fixtures_dir:
+        path = os.path.join(fixtures_dir, name)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"no fixture for {url} (expected {path})")
+        return path
+    remote_dir = os.path.join(cache_dir, "remote")
+    path = os.path.join(remote_dir, name)
+    if os.path.exists(path) and not _is_html(path):
+        return path
+    with _failures_lock:
+        retry_at, error = _failures.get(url, (0.0, None))
+    if time.monotonic() < retry_at:
+        raise error
+    try:
+        os.makedirs(remote_dir, exist_ok=True)
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            content_type = resp.headers.get_content_type()
+            if not content_type.startswith("image/"):
+                raise ValueError(f"{url} returned {content_type}, not an image")
+            with _atomic_path(path) as tmp, open(tmp, "wb") as fh:
+                shutil.copyfileobj(resp, fh)
+    except Exception as exc:
+        with _failures_lock:
+            _failures[url] = (time.monotonic() + RETRY_AFTER, exc)
+        raise
+    return path
+
+
+class AssetHandler(http.server.SimpleHTTPRequestHandler):
+    """
+    Serves cached variants; successful file responses get immutable long-lived
+    cache headers (names are content hashed), errors and redirects do not, and
+    there are no directory listings.
+    """
+
+    def send_response(self, code, message=None):
+        self._status = code
+        super().send_response(code, message)
+
+    def end_headers(self):
+        if getattr(self, "_status", None) == 200:
+            for key, value in CACHE_HEADERS.items():
+                self.send_header(key, value)
+        super().end_headers()
+
+    def list_directory(self, path):
+        self.send_error(404, "Not found")
+        return None
+
+
+def serve(port: int = 8600, cache_dir: str = CACHE_DIR):
+    """Serve <cache_dir>/variants over HTTP, e.g. behind a CDN (set PORTFOLIO_ASSET_BASE_URL in the app)."""
+    root = os.path.join(cache_dir, "variants")
+    os.makedirs(root, exist_ok=True)
+    handler = lambda *a, **kw: AssetHandler(*a, directory=root, **kw)
+    with http.server.ThreadingHTTPServer(("", port), handler) as httpd:
+        print(f"serving {root} on :{port}")
+        httpd.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build and serve resized image variants.")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_build = sub.add_parser("build", help="generate a variant and print its path")
+    p_build.add_argument("src")
+    p_build.add_argument("--width", type=int, default=360)
+    p_build.add_argument("--format", choices=sorted(FORMATS), default="webp")
+    p_serve = sub.add_parser("serve", help="serve cached variants with long-lived cache headers")
+    p_serve.add_argument("--port", type=int, default=8600)
+    args = parser.parse_args(argv)
+    if args.cmd == "build":
+        out = variant(args.src, args.width, args.format)
+        print(f"{out} ({os.path.getsize(args.src)} -> {os.path.getsize(out)} bytes)")
+    else:
+        serve(args.port)
+
+
+if __name__ == "__main__":
+    main()
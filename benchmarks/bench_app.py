@@ -0,0 +1,108 @@
+# benchmarks/bench_app.py
+# Headless rerun benchmark. Drives app.py through Streamlit's AppTest harness
+# against synthetic profiles of 10 / 100 / 1,000 skills and projects and
+# records cold start, first render, per-interaction rerun latency for the
+# `years` and `topn` sliders, and peak memory per session (peak RSS above the
+# interpreter + harness baseline). Each scale runs in a fresh interpreter so
+# cold start and memory are not shared.
+#
+#   python benchmarks/bench_app.py                  # all scales, writes benchmarks/results/app-*.json
+#   python benchmarks/bench_app.py --scales 10 100 --interactions 5
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import APP_PATH, ROOT, SCALES, build_store, summarize, write_result  # noqa: E402
+
+
+def run_scenario(store_root: str, profile_id: str, interactions: int, timeout: float) -> dict:
+    """One session: first render, then `interactions` moves of each slider. Runs in the worker process."""
+    import logging
+    import resource
+
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    t0 = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    import_ms = (time.perf_counter() - t0) * 1000
+
+    os.environ["PORTFOLIO_STORE"] = store_root
+    rss_base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    at.query_params["profile"] = profile_id
+    t0 = time.perf_counter()
+    at.run()
+    first_ms = (time.perf_counter() - t0) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+    def move(key, values):
+        times = []
+        for v in values:
+            slider = next(s for s in at.slider if s.key == key)
+            t0 = time.perf_counter()
+            slider.set_value(v).run()
+            times.append((time.perf_counter() - t0) * 1000)
+            if at.exception:
+                raise RuntimeError(at.exception[0].message)
+        return times
+
+    years = [1.0 + (9.0 * (i + 1) / interactions) // 0.25 * 0.25 for i in range(interactions)]
+    topn_max = next(s for s in at.slider if s.key == "topn").max
+    topn = [max(3, int(topn_max * (i + 1) / interactions)) for i in range(interactions)]
+    years_ms = move("years", years)
+    topn_ms = move("topn", topn)
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # KiB on Linux
+    return {
+        "harness_import_ms": round(import_ms, 3),
+        "first_render_ms": round(first_ms, 3),
+        "rerun_years_ms": summarize(years_ms),
+        "rerun_topn_ms": summarize(topn_ms),
+        "session_peak_mb": round((rss_peak - rss_base) / 1024, 2),
+        "process_peak_rss_mb": round(rss_peak / 1024, 2),
+    }
+
+
+def run_scale(store_root: str, profile_id: str, interactions: int, timeout: float) -> dict:
+    """Run the scenario in a fresh interpreter; cold start = process spawn to first render done."""
+    cmd = [sys.executable, os.path.abspath(__file__), "--worker", store_root, profile_id,
+           "--interactions", str(interactions), "--timeout", str(timeout)]
+    t0 = time.perf_counter()
+    out = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    total_ms = (time.perf_counter() - t0) * 1000
+    result = json.loads(out.strip().splitlines()[-1])
+    interaction_ms = sum(result[k]["mean"] * result[k]["n"] for k in ("rerun_years_ms", "rerun_topn_ms"))
+    result["cold_start_ms"] = round(total_ms - interaction_ms, 3)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark dashboard rerun latency headlessly.")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES))
+    parser.add_argument("--interactions", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--output", help="result file (default benchmarks/results/app-<time>-<rev>.json)")
+    parser.add_argument("--worker", nargs=2, metavar=("STORE", "PROFILE"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_scenario(*args.worker, args.interactions, args.timeout)))
+        return
+
+    results = {}
+    with tempfile.TemporaryDirectory() as root:
+        ids = build_store(root, args.scales)
+        for n in args.scales:
+            results[str(n)] = run_scale(root, ids[n], args.interactions, args.timeout)
+            print(f"scale {n}: {json.dumps(results[str(n)])}", file=sys.stderr)
+    print(write_result("app", results, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# benchmarks/common.py
+# Shared helpers for the benchmark scripts: synthetic profile stores at a given
+# scale, percentile summaries and machine-comparable result files.
+
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from store import ProfileStore, synthetic_profile  # noqa: E402
+
+APP_PATH = os.path.join(ROOT, "app.py")
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+SCALES = (10, 100, 1000)
+RESULT_SCHEMA = 1
+
+
+def build_store(root: str, scales=SCALES, seed: int = 0) -> dict:
+    """Store with one synthetic profile per scale (N skills and N projects); returns scale -> profile id."""
+    store = ProfileStore(root)
+    rng = random.Random(seed)
+    ids = {}
+    for n in scales:
+        pid = f"bench-{n}"
+        store.write_profile(pid, synthetic_profile(rng, n_skills=n, n_projects=n), commit=False)
+        ids[n] = pid
+    store.commit()
+    store.close()
+    return ids
+
+
+def summarize(samples_ms) -> dict:
+    """p50/p95/max/mean of a list of millisecond samples."""
+    s = sorted(samples_ms)
+    if not s:
+        return {"n": 0}
+    pick = lambda q: round(s[min(len(s) - 1, int(q * len(s)))], 3)
+    return {"n": len(s), "p50": pick(0.5), "p95": pick(0.95), "max": round(s[-1], 3),
+            "mean": round(sum(s) / len(s), 3)}
+
+
+def environment() -> dict:
+    """Versions and revision a result was produced with, so results can be compared across versions."""
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                             text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        rev = "unknown"
+    try:
+        import streamlit
+        st_version = streamlit.__version__
+    except ImportError:
+        st_version = None
+    return {"git_rev": rev, "python": platform.python_version(), "platform": platform.platform(),
+            "streamlit": st_version, "cpu_count": os.cpu_count()}
+
+
+def write_result(kind: str, data: dict, path=None) -> str:
+    """Write {"schema", "kind", "env", "created", "results"} JSON; returns the path."""
+    env = environment()
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{kind}-{time.strftime('%Y%m%d-%H%M%S')}-{env['git_rev']}.json")
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"schema": RESULT_SCHEMA, "kind": kind, "env": env, "created": time.time(), "results": data},
+                  fh, indent=2, sort_keys=True)
+    return path
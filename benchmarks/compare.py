@@ -0,0 +1,62 @@
+# benchmarks/compare.py
+# Compare two benchmark result files of the same kind and flag regressions.
+# Every numeric leaf is compared; metrics ending in _ms, _s, _mb, _kb or
+# _bytes (or nested under such a key) are "lower is better".
+#
+#   python benchmarks/compare.py old.json new.json --threshold 0.2
+
+import argparse
+import json
+import sys
+
+LOWER_IS_BETTER = ("_ms", "_s", "_mb", "_kb", "_bytes", "bytes_per_viewer")
+IGNORED = {"n", "created", "schema"}
+
+
+def flatten(node, prefix=""):
+    """{"a.b.c": number} for every numeric leaf."""
+    if isinstance(node, dict):
+        out = {}
+        for key, value in node.items():
+            if key not in IGNORED:
+                out.update(flatten(value, f"{prefix}.{key}" if prefix else key))
+        return out
+    if isinstance(node, (int, float)) and not isinstance(node, bool):
+        return {prefix: float(node)}
+    return {}
+
+
+def compare(old: dict, new: dict, threshold: float):
+    """Rows of (metric, old, new, relative change, regressed)."""
+    a, b = flatten(old["results"]), flatten(new["results"])
+    rows = []
+    for key in sorted(set(a) & set(b)):
+        change = (b[key] - a[key]) / a[key] if a[key] else 0.0
+        tracked = any(part.endswith(LOWER_IS_BETTER) for part in key.split("."))
+        rows.append((key, a[key], b[key], change, tracked and change > threshold))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative slowdown that counts as a regression")
+    args = parser.parse_args(argv)
+    with open(args.old, encoding="utf-8") as fh:
+        old = json.load(fh)
+    with open(args.new, encoding="utf-8") as fh:
+        new = json.load(fh)
+    if old.get("kind") != new.get("kind"):
+        sys.exit(f"cannot compare {old.get('kind')!r} with {new.get('kind')!r} results")
+
+    rows = compare(old, new, args.threshold)
+    print(f"{old['env']['git_rev']} -> {new['env']['git_rev']}")
+    for key, a, b, change, regressed in rows:
+        print(f"{'REGRESSION ' if regressed else '           '}{key:<48} {a:>12.2f} {b:>12.2f} {change:+8.1%}")
+    if any(r[4] for r in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# benchmarks/load_test.py
+# Multi-session load generator. Starts `streamlit run app.py` on a local port
+# and simulates N concurrent viewers over Streamlit's websocket protocol: each
+# viewer loads the page, then moves the `years` and `topn` sliders, timing
+# every rerun from request to the script-finished message. Needs the
+# `websockets` package (pip install websockets).
+#
+#   python benchmarks/load_test.py --viewers 50 --interactions 10 --scale 100
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import APP_PATH, ROOT, build_store, summarize, write_result  # noqa: E402
+
+FINISHED = {"FINISHED_SUCCESSFULLY", "FINISHED_FRAGMENT_RUN_SUCCESSFULLY"}
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port: int, env: dict) -> subprocess.Popen:
+    cmd = [sys.executable, "-m", "streamlit", "run", APP_PATH, "--server.headless", "true",
+           "--server.port", str(port), "--browser.gatherUsageStats", "false"]
+    proc = subprocess.Popen(cmd, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("streamlit server did not become healthy")
+
+
+class Viewer:
+    """One simulated browser session speaking the ForwardMsg/BackMsg protobuf protocol."""
+
+    def __init__(self, url: str, query: str):
+        self.url = url
+        self.query = query
+        self.widgets = {}   # widget id -> WidgetState
+        self.sliders = {}   # label -> (widget id, fragment id, slider proto)
+        self.bytes_received = 0
+
+    async def _rerun(self, ws, fragment_id: str = "") -> float:
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = self.query
+        msg.rerun_script.fragment_id = fragment_id
+        msg.rerun_script.widget_states.widgets.extend(self.widgets.values())
+        t0 = time.perf_counter()
+        await ws.send(msg.SerializeToString())
+        while True:
+            raw = await ws.recv()
+            self.bytes_received += len(raw)
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                if element.WhichOneof("type") == "slider":
+                    self.sliders[element.slider.label] = (element.slider.id, fwd.delta.fragment_id, element.slider)
+            elif kind == "script_finished":
+                status = ForwardMsg.ScriptFinishedStatus.Name(fwd.script_finished)
+                if status in FINISHED:
+                    return (time.perf_counter() - t0) * 1000
+                if status != "FINISHED_EARLY_FOR_RERUN":
+                    raise RuntimeError(f"script finished with {status}")
+
+    def _set_slider(self, label_prefix: str, rng: random.Random) -> str:
+        """Move a slider to a random legal value; returns the fragment id to rerun."""
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        widget_id, fragment_id, slider = next(v for k, v in self.sliders.items() if k.startswith(label_prefix))
+        steps = int(round((slider.max - slider.min) / slider.step))
+        state = WidgetState(id=widget_id)
+        state.double_array_value.data.append(slider.min + slider.step * rng.randint(0, steps))
+        self.widgets[widget_id] = state
+        return fragment_id
+
+    async def run(self, interactions: int, rng: random.Random) -> dict:
+        import websockets
+
+        timings = {"first_render": [], "years": [], "topn": []}
+        async with websockets.connect(self.url, subprotocols=["streamlit"], max_size=None) as ws:
+            timings["first_render"].append(await self._rerun(ws))
+            for _ in range(interactions):
+                timings["years"].append(await self._rerun(ws, self._set_slider("Total professional experience", rng)))
+                timings["topn"].append(await self._rerun(ws, self._set_slider("Top N skills", rng)))
+        return timings
+
+
+async def run_viewers(port: int, viewers: int, interactions: int, query: str, seed: int) -> dict:
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    sessions = [Viewer(url, query) for _ in range(viewers)]
+    t0 = time.perf_counter()
+    results = await asyncio.gather(*(v.run(interactions, random.Random(seed + i)) for i, v in enumerate(sessions)),
+                                   return_exceptions=True)
+    wall = time.perf_counter() - t0
+    errors = [repr(r) for r in results if isinstance(r, BaseException)]
+    ok = [r for r in results if not isinstance(r, BaseException)]
+    merged = {k: [t for r in ok for t in r[k]] for k in ("first_render", "years", "topn")}
+    reruns = sum(len(v) for v in merged.values())
+    return {
+        "viewers": viewers,
+        "errors": errors[:5],
+        "error_count": len(errors),
+        "wall_s": round(wall, 3),
+        "reruns_per_s": round(reruns / wall, 2) if wall else None,
+        "bytes_per_viewer": round(sum(v.bytes_received for v in sessions) / max(1, len(sessions))),
+        **{f"{k}_ms": summarize(v) for k, v in merged.items()},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent dashboard viewers against a local server.")
+    parser.add_argument("--viewers", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--interactions", type=int, default=5)
+    parser.add_argument("--scale", type=int, default=0, help="synthetic skills/projects per profile (0 = embedded data)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    query = ""
+    with tempfile.TemporaryDirectory() as root:
+        if args.scale:
+            ids = build_store(root, [args.scale], args.seed)
+            env["PORTFOLIO_STORE"] = root
+            query = f"profile={ids[args.scale]}"
+        port = _free_port()
+        server = start_server(port, env)
+        try:
+            results = {str(n): asyncio.run(run_viewers(port, n, args.interactions, query, args.seed))
+                       for n in args.viewers}
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+    for n, r in results.items():
+        print(f"{n} viewers: {r['reruns_per_s']} reruns/s, years p95 {r['years_ms'].get('p95')} ms", file=sys.stderr)
+    print(write_result("load", {"scale": args.scale, "interactions": args.interactions, "runs": results}, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# benchmarks/memory.py
+# Per-session memory report. Keeps K headless AppTest sessions of app.py alive
+# in one interpreter and reports the traced allocation and RSS growth per
+# session after a warm-up session has filled the shared caches. It also
+# compares, at several synthetic scales, the deep size of the nested data
+# dicts every session used to build against the shared PortfolioModel.
+#
+#   python benchmarks/memory.py                       # writes benchmarks/results/memory-*.json
+#   git worktree add /tmp/before <rev>
+#   python benchmarks/memory.py --tree /tmp/before    # the same report for another checkout
+#   python benchmarks/compare.py <before.json> <after.json>
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import ROOT, SCALES, write_result  # noqa: E402
+
+from model import PortfolioModel  # noqa: E402
+from store import profile_from_module, read_data_module, synthetic_profile  # noqa: E402
+
+
+def deep_size(obj, seen=None) -> int:
+    """Bytes of `obj` and everything reachable from it through containers and slots, each object once."""
+    seen = set() if seen is None else seen
+    stack, total = [obj], 0
+    while stack:
+        o = stack.pop()
+        if id(o) in seen or isinstance(o, type):
+            continue
+        seen.add(id(o))
+        total += sys.getsizeof(o)
+        if isinstance(o, dict) or type(o).__name__ == "mappingproxy":
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        for cls in type(o).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(o, name):
+                    stack.append(getattr(o, name))
+        if hasattr(o, "__dict__") and not isinstance(o, type):
+            stack.append(vars(o))
+    return total
+
+
+def data_sizes(profile: dict) -> dict:
+    """Deep size of the raw nested dicts vs the shared model (skill matrix excluded from both)."""
+    raw = {k: v for k, v in profile.items() if k != "skill_matrix"}
+    model = PortfolioModel.from_profile(raw)
+    model_bytes = deep_size(model)
+    return {"raw_dicts_kb": round(deep_size(raw) / 1024, 1), "model_kb": round(model_bytes / 1024, 1)}
+
+
+_SESSION_PROBE = """
+import gc, json, logging, os, resource, sys, tracemalloc
+logging.getLogger("streamlit").setLevel(logging.ERROR)
+app, sessions = sys.argv[1], int(sys.argv[2])
+from streamlit.testing.v1 import AppTest
+AppTest.from_file(app, default_timeout=300).run()  # warm-up: imports and shared caches
+gc.collect()
+rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+tracemalloc.start()
+base = tracemalloc.get_traced_memory()[0]
+keep = []
+for _ in range(sessions):
+    at = AppTest.from_file(app, default_timeout=300)
+    at.run()
+    if at.exception:
+        raise SystemExit(at.exception[0].message)
+    keep.append(at)
+gc.collect()
+traced = tracemalloc.get_traced_memory()[0] - base
+tracemalloc.stop()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss0
+print(json.dumps({"sessions": sessions, "per_session_traced_kb": round(traced / sessions / 1024, 1),
+                  "per_session_rss_kb": round(rss / sessions, 1)}))
+"""
+
+
+def measure_sessions(tree: str, sessions: int) -> dict:
+    """Per-session growth for the app.py of the checkout at `tree`, in a fresh interpreter."""
+    out = subprocess.run([sys.executable, "-c", _SESSION_PROBE, os.path.join(tree, "app.py"), str(sessions)],
+                         cwd=tree, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report per-session memory overhead.")
+    parser.add_argument("--tree", default=ROOT, help="checkout whose app.py is measured (default: this one)")
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES))
+    parser.add_argument("--output")
+    args = parser.parse_args(argv)
+
+    results = {"tree": os.path.abspath(args.tree), "sessions": measure_sessions(args.tree, args.sessions), "data": {}}
+    results["data"]["embedded"] = data_sizes(profile_from_module(read_data_module(os.path.join(ROOT, "app.py"))))
+    rng = random.Random(0)
+    for n in args.scales:
+        results["data"][str(n)] = data_sizes(synthetic_profile(rng, n_skills=n, n_projects=n))
+    s = results["sessions"]
+    print(f"{s['per_session_traced_kb']} KiB traced / {s['per_session_rss_kb']} KiB RSS per session", file=sys.stderr)
+    for scale, d in results["data"].items():
+        print(f"data {scale:>8}: {d['raw_dicts_kb']} KiB per session as dicts, {d['model_kb']} KiB once as model",
+              file=sys.stderr)
+    print(write_result("memory", results, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/payload.py
+# Animated-chart payload report. For each "Top N" value it builds the figures
+# a per-rerun slider move sends (bar, radar, cumulative timeline) at every
+# slider year and the animated bundles that ship all of those frames once, and
+# reports the average bytes per move, the bundle size and the number of moves
+# after which the bundle is cheaper. Building every frame takes seconds, so
+# this runs here instead of inside a request.
+#
+#   python benchmarks/payload.py                     # writes benchmarks/results/payload-*.json
+#   python benchmarks/payload.py --module data.py --top-n 3 6 10
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import APP_PATH, write_result  # noqa: E402
+
+from cache import ProjectionGrid  # noqa: E402
+from charts import (animated_bar_figure, animated_radar_figure, animated_timeline_figure, bar_figure,  # noqa: E402
+                    compare_payloads, radar_figure, timeline_figure)
+from model import PortfolioModel  # noqa: E402
+from store import profile_from_module, read_data_module  # noqa: E402
+from timeline import experience_series, project_forward  # noqa: E402
+
+
+def timeline_points(experience, years_grid) -> tuple:
+    """(xs, ys) of the experience history and, per slider year, (xs, ys) of its projection."""
+    hist = experience_series(experience)
+    points = lambda s: (s.index.strftime("%Y-%m-%d").tolist(), s.round(3).tolist())
+    return points(hist), [points(project_forward(hist, float(y))) for y in years_grid]
+
+
+def payload_report(grid: ProjectionGrid, history, projections, top_n: int) -> dict:
+    """compare_payloads of every slider step's per-rerun figures vs the animated bundle, as app.py sends them."""
+    xs, ys = history
+    per_tick = []
+    for y, (px, py) in zip(grid.years, projections):
+        y = float(y)
+        figs = [bar_figure(*grid.top(y, top_n), y), timeline_figure(xs, ys, px, py)]
+        if top_n >= 3:
+            figs.append(radar_figure(*grid.top(y, top_n), y))
+        per_tick.append(figs)
+    animated = [animated_bar_figure(grid, top_n), animated_timeline_figure(xs, ys, projections, grid.years)]
+    if top_n >= 3:
+        animated.append(animated_radar_figure(grid, top_n))
+    return compare_payloads(per_tick, animated)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare per-rerun chart payloads with the animated bundles.")
+    parser.add_argument("--module", default=APP_PATH, help="data module with the profile (app.py / data.py)")
+    parser.add_argument("--top-n", type=int, nargs="+", help="Top N values (default: every value of the slider)")
+    parser.add_argument("--output")
+    args = parser.parse_args(argv)
+
+    model = PortfolioModel.from_profile(profile_from_module(read_data_module(args.module)))
+    grid = ProjectionGrid(model.skill_matrix)
+    history, projections = timeline_points(model.experience, grid.years)
+    results = {}
+    for top_n in args.top_n or range(3, len(model.skills) + 1):
+        report = results[str(top_n)] = payload_report(grid, history, projections, top_n)
+        print(f"top {top_n:>3}: {report['animated_bytes'] / 1024:8.0f} KB animated vs "
+              f"{report['per_tick_bytes'] / 1024:6.0f} KB per move, break-even after "
+              f"{report['break_even_ticks']} moves", file=sys.stderr)
+    print(write_result("payload", results, args.output))
+
+
+if __name__ == "__main__":
+    main()
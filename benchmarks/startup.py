@@ -0,0 +1,167 @@
+# benchmarks/startup.py
+# Cold-start benchmark. Imports each module in a fresh interpreter under
+# `python -X importtime` and reports its import time with a per-package
+# breakdown (self time summed by top-level package), then runs app.py's
+# module-top code through the profile column and checks which heavy libraries
+# the app's own code imported on the way (Streamlit's own imports aside), and
+# times a fresh process to the end of the first headless render.
+#
+#   python benchmarks/startup.py                   # writes benchmarks/results/startup-*.json
+#   python benchmarks/startup.py --check           # exit 1 if the first paint loads a heavy library
+#   python benchmarks/startup.py --modules pandas charts --repeat 5
+
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import APP_PATH, ROOT, summarize, write_result  # noqa: E402
+
+MODULES = ("streamlit", "numpy", "pandas", "plotly.graph_objects", "PIL.Image",
+           "sections", "profiling", "projection", "cache", "core", "charts", "timeline", "store", "assets")
+HEAVY = ("numpy", "pandas", "plotly", "PIL", "sklearn", "matplotlib", "scipy")
+TOP_PACKAGES = 10
+
+
+def parse_importtime(stderr: str) -> dict:
+    """{package: self ms} from -X importtime output, summed by top-level package name."""
+    packages = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        root = name.strip().split(".")[0]
+        packages[root] = packages.get(root, 0.0) + int(self_us) / 1000
+    return packages
+
+
+def measure_module(module: str, repeat: int) -> dict:
+    """Wall time of `python -c "import module"` and its import-time breakdown (median run)."""
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                              cwd=ROOT, capture_output=True, text=True)
+        wall = (time.perf_counter() - t0) * 1000
+        if proc.returncode:
+            return {"error": proc.stderr.strip().splitlines()[-1]}
+        runs.append((wall, parse_importtime(proc.stderr)))
+    runs.sort(key=lambda r: r[0])
+    wall, packages = runs[len(runs) // 2]
+    top = sorted(packages.items(), key=lambda kv: -kv[1])[:TOP_PACKAGES]
+    return {"wall_ms": summarize([r[0] for r in runs]), "import_ms": round(sum(packages.values()), 3),
+            "packages_ms": {k: round(v, 3) for k, v in top}}
+
+
+def profile_prefix(path: str = APP_PATH) -> str:
+    """app.py's source up to the end of the top-level statement that renders the profile column."""
+    with open(path, encoding="utf-8") as fh:
+        source = fh.read()
+    for node in ast.parse(source, path).body:
+        calls = [n for n in ast.walk(node) if isinstance(n, ast.Call) and isinstance(n.func, ast.Name)]
+        if any(call.func.id == "render_profile" for call in calls) and not isinstance(node, ast.FunctionDef):
+            return "\n".join(source.splitlines()[:node.end_lineno]) + "\n"
+    raise SystemExit(f"{path} never calls render_profile()")
+
+
+_EAGER_PROBE = """
+import json, logging, os, sys, sysconfig, time
+logging.getLogger("streamlit").setLevel(logging.ERROR)
+from streamlit.testing.v1 import AppTest
+heavy = set(json.loads(sys.argv[1]))
+libraries = tuple(sysconfig.get_paths()[k] for k in ("stdlib", "purelib", "platlib"))
+importers = {}
+
+class FirstImport:
+    # the file whose import statement first loads each heavy package; Streamlit's own
+    # lazy imports (numpy behind st.image) come from site-packages and are not the app's
+    def find_spec(self, name, path=None, target=None):
+        if name in heavy and name not in sys.modules and name not in importers:
+            frame = sys._getframe(1)
+            while frame.f_code.co_filename.startswith("<frozen"):
+                frame = frame.f_back
+            importers[name] = frame.f_code.co_filename
+        return None
+
+sys.meta_path.insert(0, FirstImport())
+at = AppTest.from_string(sys.stdin.read(), default_timeout=300)
+t0 = time.perf_counter()
+at.run()
+ms = (time.perf_counter() - t0) * 1000
+if at.exception:
+    raise SystemExit(at.exception[0].message)
+app = {k: os.path.relpath(f) for k, f in importers.items() if not os.path.abspath(f).startswith(libraries)}
+print(json.dumps({"profile_ms": round(ms, 3), "eager_heavy": sorted(app), "importers": app}))
+"""
+
+
+def measure_app_imports() -> dict:
+    """
+    Run app.py's module-top code through the profile column in a fresh
+    interpreter; returns its time and the heavy packages the app's own code
+    imported, with the file that imported each. Imports reached through calls
+    (the data watcher, the profile section) count, not just app.py's import
+    statements; those Streamlit makes itself do not.
+    """
+    # the prefix runs from a temporary file, so point the data source back at app.py's literals
+    env = {**os.environ, "PORTFOLIO_DATA": os.environ.get("PORTFOLIO_DATA", APP_PATH)}
+    out = subprocess.run([sys.executable, "-c", _EAGER_PROBE, json.dumps(HEAVY)], input=profile_prefix(),
+                         cwd=ROOT, env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+_RENDER_PROBE = """
+import logging, sys, time
+t0 = time.perf_counter()
+logging.getLogger("streamlit").setLevel(logging.ERROR)
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=300)
+at.run()
+if at.exception:
+    raise SystemExit(at.exception[0].message)
+print(round((time.perf_counter() - t0) * 1000, 3))
+"""
+
+
+def measure_first_render(repeat: int) -> dict:
+    """Fresh interpreter to end of the first headless render, harness import included."""
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", _RENDER_PROBE, APP_PATH],
+                             cwd=ROOT, capture_output=True, text=True, check=True).stdout
+        samples.append(float(out.strip().splitlines()[-1]))
+    return summarize(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure import-time and cold-start cost.")
+    parser.add_argument("--modules", nargs="+", default=list(MODULES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-render", action="store_true", help="skip the first-render timing")
+    parser.add_argument("--check", action="store_true", help="fail if the profile column's first paint loads a heavy library")
+    parser.add_argument("--output")
+    args = parser.parse_args(argv)
+
+    results = {"modules": {}, "app": measure_app_imports()}
+    for module in args.modules:
+        results["modules"][module] = measure_module(module, args.repeat)
+        print(f"{module:<22} {json.dumps(results['modules'][module].get('wall_ms', {}).get('p50'))} ms",
+              file=sys.stderr)
+    if not args.no_render:
+        results["first_render_ms"] = measure_first_render(args.repeat)
+    app = results["app"]
+    print(f"app.py through the profile column: {app['profile_ms']} ms, heavy: {app['eager_heavy'] or 'none'}",
+          file=sys.stderr)
+    print(write_result("startup", results, args.output))
+    if args.check and app["eager_heavy"]:
+        sys.exit("loaded before the profile column renders: "
+                 + ", ".join(f"{name} (imported by {app['importers'][name]})" for name in app["eager_heavy"]))
+
+
+if __name__ == "__main__":
+    main()
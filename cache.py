@@ -0,0 +1,103 @@
+# cache.py
+# Rerun caching: the projection table for every legal slider value is computed
+# once per data version, and figure specs are memoized by (years, top_n, theme)
+# in a bounded LRU so unchanged slider combinations skip all rebuilding.
+
+import numpy as np
+
+from lru import LRUCache
+from projection import SkillMatrix, slider_years
+
+
+class ProjectionGrid:
+    """Rounded projections for every slider year, with per-year descending sort order."""
+
+    def __init__(self, matrix: SkillMatrix, years=None, values=None):
+        self.matrix = matrix
+        self.years = slider_years() if years is None else np.asarray(years, dtype=np.float64)
+        self.values = np.round(matrix.project(self.years), 1) if values is None else values
+        # stable sort on the negated values keeps the original skill order for ties
+        self.order = np.argsort(-self.values, axis=1, kind="stable")
+
+    def updated(self, matrix: SkillMatrix, changed=()) -> "ProjectionGrid":
+        """Grid for `matrix` that projects only new skills and those named in `changed`; other columns are copied."""
+        old = {name: i for i, name in enumerate(self.matrix.names)}
+        keep = [(j, old[name]) for j, name in enumerate(matrix.names) if name in old and name not in changed]
+        values = np.empty((len(self.years), len(matrix)))
+        if keep:
+            new_cols, old_cols = (list(c) for c in zip(*keep))
+            values[:, new_cols] = self.values[:, old_cols]
+        fresh = sorted(set(range(len(matrix))) - {j for j, _ in keep})
+        if fresh:
+            values[:, fresh] = np.round(matrix.take(fresh).project(self.years), 1)
+        return ProjectionGrid(matrix, self.years, values)
+
+    def row(self, years: float) -> int:
+        """Grid row of a slider value (nearest legal year)."""
+        i = int(np.searchsorted(self.years, years))
+        if i == len(self.years) or (i > 0 and years - self.years[i - 1] < self.years[i] - years):
+            i -= 1
+        return max(i, 0)
+
+    def top_index(self, years: float, n=None):
+        """Skill positions of the top `n` skills at `years`, best first."""
+        r = self.row(years)
+        return self.order[r] if n is None else self.order[r, :int(n)]
+
+    def top(self, years: float, n=None):
+        """(skills, current, predicted) of the top `n` skills at `years`, best first."""
+        r = self.row(years)
+        idx = self.top_index(years, n)
+        names = [self.matrix.names[i] for i in idx]
+        return names, self.matrix.base[idx].tolist(), self.values[r, idx].tolist()
+
+
+# Which parts of the profile each artifact kind is built from (see watch.ModelDiff.groups);
+# kinds not listed are dropped on any data change.
+ARTIFACT_DEPS = {
+    "bar": {"skills"}, "bar_anim": {"skills"}, "bar_forecast": {"skills"},
+    "radar": {"skills"}, "radar_anim": {"skills"},
+    "forecast": {"skills"}, "fan_forecast": {"skills"},
+    "milestones": {"skills", "projects"},
+    "experience": {"experience"}, "timeline": {"experience"}, "timeline_anim": {"experience"},
+    "project_index": {"projects"},
+}
+
+
+class PortfolioCache:
+    """All rerun-derived artifacts for one data version, shared by every session."""
+
+    def __init__(self, version: str, skills, maxsize: int = 256, grid: ProjectionGrid = None):
+        self.version = version
+        if grid is None:
+            grid = ProjectionGrid(skills if isinstance(skills, SkillMatrix) else SkillMatrix.from_skills(skills))
+        self.grid = grid
+        self.artifacts = LRUCache(maxsize)
+        self.inherited = {"kept": 0, "updated": 0, "dropped": 0}
+
+    def get(self, kind: str, key: tuple, build):
+        """Memoized artifact (figure dict, milestones, ...) for `kind` and its slider key."""
+        return self.artifacts.get_or_build((self.version, kind) + tuple(key), build)
+
+    def derive(self, version: str, matrix: SkillMatrix, diff, updaters=None) -> "PortfolioCache":
+        """
+        Cache for the next data version that keeps every artifact not built from
+        the parts of the profile in `diff.groups` (a watch.ModelDiff). Only the
+        skills in `diff.skills` are re-projected. An artifact whose kind has an
+        entry in `updaters` is patched by it instead of being dropped.
+        """
+        grid = self.grid.updated(matrix, diff.skills)
+        new = PortfolioCache(version, matrix, self.artifacts.maxsize, grid)
+        updaters = updaters or {}
+        for (_, kind, *key), value in self.artifacts.items():
+            deps = ARTIFACT_DEPS.get(kind)
+            if deps is not None and not deps & diff.groups:
+                new.inherited["kept"] += 1
+            elif kind in updaters:
+                value = updaters[kind](value)
+                new.inherited["updated"] += 1
+            else:
+                new.inherited["dropped"] += 1
+                continue
+            new.artifacts.put((version, kind) + tuple(key), value)
+        return new
@@ -0,0 +1,180 @@
+# charts.py
+# Plotly figure builders for the dashboard. Each builder returns a plain figure
+# dict so it can be memoized and handed to st.plotly_chart unchanged. Plotly is
+# imported inside the builders: cache hits never need it.
+
+THEME = "plotly_dark"
+
+
+def bar_figure(skills, current, predicted, years: float, theme: str = THEME) -> dict:
+    """Grouped current vs predicted bar chart for the top skills."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=list(skills), y=list(current), name="Current"))
+    fig.add_trace(go.Bar(x=list(skills), y=list(predicted), name=f"Predicted @ {years} yrs"))
+    fig.update_layout(barmode='group', yaxis=dict(range=[0,100]), template=theme, margin=dict(t=20,b=10))
+    return fig.to_dict()
+
+
+def radar_figure(skills, current, predicted, years: float, theme: str = THEME) -> dict:
+    """Closed radar (polar) chart of current vs predicted levels; needs at least 3 skills."""
+    import plotly.graph_objects as go
+
+    cats = list(skills)
+    vals_cur = list(current)
+    vals_pred = list(predicted)
+    cats_loop = cats + [cats[0]]
+    vals_cur_loop = vals_cur + [vals_cur[0]]
+    vals_pred_loop = vals_pred + [vals_pred[0]]
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(r=vals_cur_loop, theta=cats_loop, fill='toself', name='Current'))
+    fig.add_trace(go.Scatterpolar(r=vals_pred_loop, theta=cats_loop, fill='toself', name=f'Predicted @ {years} yrs'))
+    fig.update_layout(polar=dict(radialaxis=dict(visible=True, range=[0,100])), template=theme, margin=dict(t=10,b=10))
+    return fig.to_dict()
+
+
+def timeline_figure(xs, ys, proj_xs=(), proj_ys=(), theme: str = THEME) -> dict:
+    """Cumulative experience line chart, with the slider projection as a dashed continuation."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=list(xs), y=list(ys), mode="lines+markers", name="Cumulative experience (years)"))
+    fig.add_trace(go.Scatter(x=list(proj_xs), y=list(proj_ys), mode="lines", line=dict(dash="dash"),
+                             name="Projected (slider)"))
+    fig.update_layout(template=theme, yaxis=dict(title="Years (cumulative)"), margin=dict(t=10,b=10))
+    return fig.to_dict()
+
+
+# -------------------------
+# Monte Carlo forecast bands (see forecast.py)
+# -------------------------
+def forecast_bar_figure(skills, current, bands, years: float, theme: str = THEME) -> dict:
+    """Current vs median predicted bars, with P10-P90 whiskers; `bands` is (3, n) P10/P50/P90."""
+    import plotly.graph_objects as go
+
+    p10, p50, p90 = ([round(float(v), 1) for v in row] for row in bands)
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=list(skills), y=list(current), name="Current"))
+    fig.add_trace(go.Bar(x=list(skills), y=p50, name=f"P50 @ {years} yrs",
+                         error_y=dict(type="data", symmetric=False, array=[hi - mid for hi, mid in zip(p90, p50)],
+                                      arrayminus=[mid - lo for mid, lo in zip(p50, p10)]),
+                         customdata=list(zip(p10, p90)),
+                         hovertemplate="%{x}: %{y} (P10 %{customdata[0]}, P90 %{customdata[1]})<extra></extra>"))
+    fig.update_layout(barmode='group', yaxis=dict(range=[0,100]), template=theme, margin=dict(t=20,b=10))
+    return fig.to_dict()
+
+
+def forecast_fan_figure(grid_years, mean_bands, years: float, theme: str = THEME) -> dict:
+    """Average skill level over the year grid: P50 line inside a shaded P10-P90 band, slider year marked."""
+    import plotly.graph_objects as go
+
+    xs = [float(y) for y in grid_years]
+    p10, p50, p90 = ([round(float(v), 2) for v in col] for col in zip(*mean_bands))
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=xs, y=p90, mode="lines", line=dict(width=0), name="P90", showlegend=False))
+    fig.add_trace(go.Scatter(x=xs, y=p10, mode="lines", line=dict(width=0), fill="tonexty",
+                             fillcolor="rgba(99,110,250,0.25)", name="P10-P90"))
+    fig.add_trace(go.Scatter(x=xs, y=p50, mode="lines", name="P50 (average skill level)"))
+    fig.add_vline(x=float(years), line_dash="dot")
+    fig.update_layout(template=theme, xaxis=dict(title="Experience (years)"), yaxis=dict(title="Average level"),
+                      margin=dict(t=10,b=10))
+    return fig.to_dict()
+
+# -------------------------
+# Client-side animation: every slider step shipped once as Plotly frames
+# -------------------------
+def _closed(seq):
+    seq = list(seq)
+    return seq + seq[:1]
+
+
+def _animate(fig: dict, steps, frames, prefix: str, traces=None) -> dict:
+    """
+    Attach animation frames plus an in-browser slider and play button to a figure dict.
+    `traces` limits frames to the listed trace indices (the others are sent once).
+    """
+    labels = [f"{s:g}" for s in steps]
+    frame_args = {"mode": "immediate", "frame": {"duration": 0, "redraw": True}, "transition": {"duration": 0}}
+    fig["frames"] = [{"name": label, "data": data} for label, data in zip(labels, frames)]
+    if traces is not None:
+        for frame in fig["frames"]:
+            frame["traces"] = list(traces)
+    fig["layout"]["sliders"] = [{
+        "active": 0,
+        "currentvalue": {"prefix": prefix},
+        "pad": {"t": 30},
+        "steps": [{"method": "animate", "label": label, "args": [[label], frame_args]} for label in labels],
+    }]
+    fig["layout"]["updatemenus"] = [{
+        "type": "buttons",
+        "showactive": False,
+        "x": 0, "y": 0, "xanchor": "right", "yanchor": "top",
+        "pad": {"t": 30, "r": 10},
+        "buttons": [{"label": "Play", "method": "animate",
+                     "args": [None, {"frame": {"duration": 150, "redraw": True}, "fromcurrent": True}]}],
+    }]
+    return fig
+
+
+def animated_bar_figure(grid, top_n: int, theme: str = THEME) -> dict:
+    """Bar chart with one frame per grid year; `grid` is a cache.ProjectionGrid."""
+    years = [float(y) for y in grid.years]
+    tops = [grid.top(y, top_n) for y in years]
+    frames = [[{"type": "bar", "x": s, "y": c, "name": "Current"},
+               {"type": "bar", "x": s, "y": p, "name": f"Predicted @ {y} yrs"}]
+              for (s, c, p), y in zip(tops, years)]
+    fig = bar_figure(*tops[0], years[0], theme)
+    return _animate(fig, years, frames, "Experience (years): ")
+
+
+def animated_radar_figure(grid, top_n: int, theme: str = THEME) -> dict:
+    """Radar chart with one frame per grid year; needs top_n >= 3."""
+    years = [float(y) for y in grid.years]
+    tops = [grid.top(y, top_n) for y in years]
+    frames = [[{"type": "scatterpolar", "r": _closed(c), "theta": _closed(s), "fill": "toself", "name": "Current"},
+               {"type": "scatterpolar", "r": _closed(p), "theta": _closed(s), "fill": "toself",
+                "name": f"Predicted @ {y} yrs"}]
+              for (s, c, p), y in zip(tops, years)]
+    fig = radar_figure(*tops[0], years[0], theme)
+    return _animate(fig, years, frames, "Experience (years): ")
+
+
+def animated_timeline_figure(xs, ys, frame_projs, years, theme: str = THEME) -> dict:
+    """
+    Cumulative line chart with one frame per entry in `years`; `frame_projs`
+    holds the (xs, ys) projection for each. Only the projection trace is animated.
+    """
+    frame_projs = [(list(px), list(py)) for px, py in frame_projs]
+    frames = [[{"type": "scatter", "x": px, "y": py}] for px, py in frame_projs]
+    fig = timeline_figure(xs, ys, *frame_projs[0], theme=theme)
+    # keep the x axis wide enough for the longest projection
+    ends = [px[-1] for px, _ in frame_projs if px]
+    if ends and xs:
+        fig["layout"]["xaxis"] = {**fig["layout"].get("xaxis", {}), "range": [xs[0], max(ends)]}
+    return _animate(fig, [float(y) for y in years], frames, "Experience (years): ", traces=[1])
+
+
+def figure_bytes(fig: dict) -> int:
+    """Serialized size of a figure, i.e. what st.plotly_chart ships to the browser."""
+    import plotly.io as pio
+
+    return len(pio.to_json(fig, validate=False).encode("utf-8"))
+
+
+def compare_payloads(per_tick_figs, animated_figs) -> dict:
+    """
+    Compare per-rerun transfer against the one-off animated bundle.
+    `per_tick_figs` is a list (one entry per slider position) of the figures a
+    rerun sends; `animated_figs` are the figures sent once in animated mode.
+    """
+    ticks = [sum(figure_bytes(f) for f in figs) for figs in per_tick_figs]
+    per_tick = sum(ticks) / len(ticks) if ticks else 0.0
+    animated = sum(figure_bytes(f) for f in animated_figs)
+    return {
+        "per_tick_bytes": round(per_tick),
+        "full_scrub_bytes": sum(ticks),
+        "animated_bytes": animated,
+        # number of slider moves after which shipping all frames up front is cheaper
+        "break_even_ticks": int(-(-animated // per_tick)) if per_tick else None,
+    }
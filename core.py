@@ -0,0 +1,71 @@
+# core.py
+# UI-free portfolio logic shared by the Streamlit app and the offline scoring
+# CLI (score.py): skill accessors, the predicted-timeline heuristic and batched
+# skill projection across many profiles at once.
+
+import numpy as np
+
+from projection import SkillMatrix
+
+# -------------------------
+# Skill accessors and the predicted-timeline heuristic (rules: timeline_rules.json, rules.py)
+# -------------------------
+MILESTONE_YEARS = (1, 3, 5)
+
+
+def skill_level(meta: dict) -> float:
+    """Current level of a skill in either the app.py ("level") or data.py ("base") schema."""
+    return meta.get("level", meta.get("base", 0))
+
+
+def skill_area(meta: dict) -> str:
+    """Area of a skill in either the app.py ("area") or data.py ("category") schema."""
+    return meta.get("area", meta.get("category"))
+
+
+def predict_timeline_heuristic(skills: dict, n_projects: int, years: float, engine=None):
+    """
+    Lightweight deterministic 'LLM-ish' timeline generator - offline heuristic.
+    Returns simple milestones for year 1, 3, 5 (from `engine`, default rules.default_engine()).
+    """
+    if engine is None:
+        from rules import default_engine
+        engine = default_engine()
+    return engine.evaluate_profiles([{"skills": skills, "n_projects": n_projects}], years)[0]
+
+
+# -------------------------
+# Batched scoring across many profiles
+# -------------------------
+def score_batch(profiles: list, years) -> list:
+    """
+    Projected skills at each of `years` plus year-1/3/5 milestones for every
+    profile. All skills of all profiles are concatenated and projected in one
+    broadcast; milestones come from one batched pass of the rule engine.
+
+    Each profile is a dict with "skills" (either schema), and optionally "id",
+    "n_projects" or "projects", and "experience_years" (defaults to max(years)).
+    """
+    from rules import default_engine
+
+    years = np.asarray(years, dtype=np.float64)
+    skill_dicts = [p.get("skills", {}) for p in profiles]
+    counts = np.array([len(s) for s in skill_dicts], dtype=np.int64)
+    combined = SkillMatrix.from_items(item for s in skill_dicts for item in s.items())
+    proj = np.round(combined.project(years), 1)
+
+    exp_years = np.array([p.get("experience_years", years.max() if len(years) else 0.0) for p in profiles],
+                         dtype=np.float64)
+    milestones = default_engine().evaluate_profiles(profiles, exp_years)
+
+    bounds = np.concatenate([[0], np.cumsum(counts)])
+    results = []
+    rows = proj.tolist()
+    for i, (profile, skills) in enumerate(zip(profiles, skill_dicts)):
+        lo, hi = bounds[i], bounds[i + 1]
+        results.append({
+            "id": profile.get("id"),
+            "projected": {f"{y:g}": dict(zip(skills, row[lo:hi])) for y, row in zip(years, rows)},
+            "milestones": milestones[i],
+        })
+    return results
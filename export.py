@@ -0,0 +1,382 @@
+# export.py
+# Static export of the dashboard. Renders the whole page - profile, KPIs,
+# projects, certifications and every chart state of the `years` x `topn`
+# sliders - to a directory of plain files that any static file server or CDN
+# can host. Chart states are computed in one batched pass (one projection
+# broadcast over all slider years, one rule-engine pass for the milestones)
+# and stored once: a state's top-N bars are a prefix of its year's sort order,
+# identical projection rows / orders / timeline points are shared between
+# years, and the Plotly template is sent once for all charts. plotly.js
+# redraws a state in the browser when a slider moves. Features that need a
+# server (Monte Carlo forecast, other stored profiles) link to the live app.
+#
+#   python export.py                                   # embedded data of app.py -> site/
+#   python export.py --out /var/www/portfolio --live-url https://portfolio.example.com
+#   python export.py --store profiles/ --profile dhrubo --plotly-js cdn
+
+import argparse
+import gzip
+import html
+import json
+import os
+import shutil
+import sys
+import time
+from string import Template
+
+import numpy as np
+
+from assets import gdrive_direct_url, resolve_remote, variant
+from cache import ProjectionGrid
+from fragments import PageFragments
+from model import PortfolioModel
+from projection import YEARS_MAX, YEARS_MIN, YEARS_STEP
+from store import ProfileStore, profile_from_module, read_data_module
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(ROOT, "app.py")
+TOP_N_DEFAULT = 6
+THUMB_WIDTH = 360
+
+PAGE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>$title</title>
+<script src="$plotly_src"></script>
+<style>
+body { margin:0; background:#0e1117; color:#fafafa; font-family:"Inter","Source Sans Pro",sans-serif; }
+a { color:#8ab4ff; }
+.page { display:grid; grid-template-columns:1fr 3fr; gap:48px; max-width:1400px; margin:0 auto; padding:48px 32px; }
+.kpis { display:grid; grid-template-columns:repeat(3,1fr); gap:16px; }
+.kpi-label { color:rgba(250,250,250,0.6); font-size:14px; } .kpi-value { font-size:28px; }
+.charts { display:grid; grid-template-columns:2fr 3fr; gap:24px; }
+.caption { color:rgba(250,250,250,0.6); font-size:14px; }
+hr { border:none; border-top:1px solid rgba(250,250,250,0.2); margin:24px 0; }
+input[type=range] { width:100%; } input[type=search] { width:100%; padding:8px; background:#262730; color:#fafafa; border:none; border-radius:6px; }
+details { margin:0 0 16px; } summary { cursor:pointer; font-weight:600; color:#14b8a6; }
+</style>
+</head>
+<body>
+<div class="page">
+<aside>
+$image
+<h3><span style="color:#cfcfff">$name</span></h3>
+<p><strong>$headline</strong></p>
+$about
+<hr>
+$contact
+$resume
+</aside>
+<main>
+<div class="kpis">
+<div><div class="kpi-label">Role</div><div class="kpi-value">Associate Data Scientist → Ready for ML Engineer</div></div>
+<div><div class="kpi-label">Projects</div><div class="kpi-value">$n_projects</div></div>
+<div><div class="kpi-label">Certifications</div><div class="kpi-value">$n_certifications</div></div>
+</div>
+<hr>
+<label>Total professional experience (years): <strong id="years-value"></strong>
+<input type="range" id="years" min="$years_min" max="$years_max" step="$years_step" value="$years_min"></label>
+<p><strong>Selected experience:</strong> <span id="years-selected"></span> yrs</p>
+$live_note
+<hr>
+<h2>Skill Projection</h2>
+<div class="charts">
+<div><h3>Top Skills (predicted)</h3>
+<label>Top N skills to show: <strong id="topn-value"></strong>
+<input type="range" id="topn" min="$topn_min" max="$topn_max" step="1" value="$topn_default"></label>
+<div id="bar"></div></div>
+<div><h3>Detailed Skill Radar</h3><div id="radar"></div><p id="radar-note" class="caption" hidden>Select at least 3 top skills to render radar chart.</p></div>
+</div>
+<hr>
+<h2>Experience Growth (Cumulative timeline)</h2>
+<div id="timeline"></div>
+<p><strong>Notes:</strong> Cumulative experience is computed from the listed internships and current role (overlapping roles count once). Move the slider (1–10 yrs) to simulate projected cumulative experience (dashed).</p>
+<hr>
+<h2>Predicted Timeline (heuristic)</h2>
+<p id="milestones-basis"></p>
+<div id="milestones"></div>
+<hr>
+<h2>Selected Projects</h2>
+<input type="search" id="project-query" placeholder="Search projects, e.g. sentiment, pytorch">
+<div id="projects">
+$projects
+</div>
+<p id="project-count" class="caption"></p>
+<hr>
+<h2>Certifications</h2>
+$certifications
+<hr>
+<p class="caption">Static export of the portfolio dashboard, generated $generated.</p>
+</main>
+</div>
+<script id="chart-data" type="application/json">$data</script>
+<script>
+$script
+</script>
+</body>
+</html>
+""")
+
+SCRIPT = """
+const D = JSON.parse(document.getElementById("chart-data").textContent);
+const $ = (id) => document.getElementById(id);
+const fmt = (y) => Number.isInteger(y) ? y.toFixed(1) : String(y);
+const layout = (name) => Object.assign({}, D.layouts[name], {template: D.template});
+const config = {responsive: true, displaylogo: false};
+
+function render() {
+  const i = Math.round(($("years").value - D.years[0]) / D.step), n = +$("topn").value, y = D.years[i];
+  $("years-value").textContent = $("years-selected").textContent = fmt(y);
+  $("topn-value").textContent = n;
+  const row = D.rows[D.year_row[i]], order = D.orders[D.year_order[i]].slice(0, n);
+  const skills = order.map((k) => D.skills[k]), cur = order.map((k) => D.current[k]), pred = order.map((k) => row[k]);
+  const label = "Predicted @ " + fmt(y) + " yrs";
+  Plotly.react("bar", [{type: "bar", x: skills, y: cur, name: "Current"},
+                       {type: "bar", x: skills, y: pred, name: label}], layout("bar"), config);
+  const radar = skills.length >= 3;
+  $("radar").hidden = !radar; $("radar-note").hidden = radar;
+  if (radar) {
+    const loop = (a) => a.concat(a.slice(0, 1));
+    Plotly.react("radar", [{type: "scatterpolar", r: loop(cur), theta: loop(skills), fill: "toself", name: "Current"},
+                           {type: "scatterpolar", r: loop(pred), theta: loop(skills), fill: "toself", name: label}],
+                 layout("radar"), config);
+  }
+  const [k, tx, ty] = D.projection.cuts[i], base = D.projection.base;
+  Plotly.react("timeline", [
+    {type: "scatter", x: D.history[0], y: D.history[1], mode: "lines+markers", name: "Cumulative experience (years)"},
+    {type: "scatter", x: base[0].slice(0, k).concat(tx), y: base[1].slice(0, k).concat(ty), mode: "lines",
+     line: {dash: "dash"}, name: "Projected (slider)"}], layout("timeline"), config);
+  $("milestones-basis").innerHTML = "<strong>Based on:</strong> " + D.skills.length + " skills, " +
+    D.n_projects + " projects, and " + fmt(y) + " yrs experience.";
+  $("milestones").innerHTML = D.milestone_years.map((my, j) =>
+    "<p><strong>Year " + my + ":</strong> " + D.texts[D.milestones[i][j]] + "</p>").join("");
+}
+
+function filterProjects() {
+  const terms = $("project-query").value.toLowerCase().split(/[^a-z0-9]+/).filter(Boolean);
+  let shown = 0;
+  for (const card of document.querySelectorAll("#projects .project")) {
+    const match = terms.every((t) => card.dataset.text.includes(t));
+    card.hidden = !match; shown += match;
+  }
+  $("project-count").textContent = shown + " of " + D.n_projects + " projects";
+}
+
+$("years").addEventListener("input", render);
+$("topn").addEventListener("input", render);
+$("project-query").addEventListener("input", filterProjects);
+render();
+filterProjects();
+"""
+
+
+# -------------------------
+# Chart states
+# -------------------------
+def _dedupe_rows(rows: np.ndarray):
+    """(unique rows, index of each input row into them), first occurrence order."""
+    unique, first, inverse = np.unique(rows, axis=0, return_index=True, return_inverse=True)
+    rank = np.argsort(np.argsort(first))
+    return unique[np.argsort(first)], rank[inverse.reshape(-1)]
+
+
+def _timeline_states(experience, years):
+    """History points once; each year's projection as a shared prefix of the longest one plus its own tail."""
+    from timeline import experience_series, project_forward
+
+    hist = experience_series(experience)
+    points = lambda s: (s.index.strftime("%Y-%m-%d").tolist(), s.round(3).tolist())
+    projections = [points(project_forward(hist, float(y))) for y in years]
+    base = max(projections, key=lambda p: len(p[0]))
+    cuts = []
+    for xs, ys in projections:
+        k = 0
+        while k < len(xs) and k < len(base[0]) and (xs[k], ys[k]) == (base[0][k], base[1][k]):
+            k += 1
+        cuts.append([k, xs[k:], ys[k:]])
+    return points(hist), {"base": list(base), "cuts": cuts}
+
+
+def chart_data(model: PortfolioModel, theme: str) -> dict:
+    """Everything the page's charts need for every (years, topn) slider state, deduplicated."""
+    from charts import bar_figure, radar_figure, timeline_figure
+    from rules import default_engine
+
+    grid = ProjectionGrid(model.skill_matrix)
+    years = [float(y) for y in grid.years]
+    rows, year_row = _dedupe_rows(grid.values)
+    orders, year_order = _dedupe_rows(grid.order)
+
+    profile = {"skills": model.skills, "n_projects": len(model.projects)}
+    milestones = default_engine().evaluate_profiles([profile] * len(years), years)
+    milestone_years = sorted(milestones[0]) if milestones else []
+    texts = {}
+    milestone_ids = [[texts.setdefault(html.escape(m[year]), len(texts)) for year in milestone_years]
+                     for m in milestones]
+
+    history, projection = _timeline_states(model.experience, years)
+
+    # Layouts (axes, margins) come from the app's own builders; traces are filled in by the page
+    layouts = {"bar": bar_figure([], [], [], years[0], theme)["layout"],
+               "radar": radar_figure(["", "", ""], [0] * 3, [0] * 3, years[0], theme)["layout"],
+               "timeline": timeline_figure([], [], theme=theme)["layout"]}
+    template = layouts["bar"].pop("template")
+    for layout in layouts.values():
+        layout.pop("template", None)
+
+    return {
+        "years": years, "step": YEARS_STEP, "skills": list(model.skill_matrix.names),
+        "current": np.round(model.skill_matrix.base, 1).tolist(),
+        "rows": rows.tolist(), "year_row": year_row.tolist(),
+        "orders": orders.tolist(), "year_order": year_order.tolist(),
+        "history": list(history), "projection": projection,
+        "milestone_years": milestone_years, "texts": list(texts), "milestones": milestone_ids,
+        "n_projects": len(model.projects), "layouts": layouts, "template": template,
+    }
+
+
+# -------------------------
+# Page
+# -------------------------
+def _project_cards(model: PortfolioModel, cards) -> str:
+    """Fragment cards with their details inline and the text the page's filter matches against."""
+    out = []
+    for proj, card in zip(model.projects, cards):
+        text = " ".join([proj.get("title", ""), proj.get("short_description", ""), proj.get("long_description", ""),
+                         " ".join(proj.get("tech", ()))]).lower()
+        details = html.escape(proj.get("long_description", ""))
+        if proj.get("link"):
+            details += f'<br><a href="{html.escape(proj["link"])}" target="_blank">Repository</a>'
+        out.append(f'<div class="project" data-text="{html.escape(text)}">{card}'
+                   f'<details><summary>Read more / Details</summary><p>{details}</p></details></div>')
+    return "\n".join(out)
+
+
+def _profile_image(model: PortfolioModel, local_path: str, out_dir: str, written: list) -> str:
+    """Thumbnail copied next to the page, from the local image or the share link; "" if neither loads."""
+    try:
+        src = local_path if local_path and os.path.exists(local_path) else (
+            resolve_remote(gdrive_direct_url(model.image_link)) if model.image_link else None)
+        if not src:
+            return ""
+        thumb = variant(src, THUMB_WIDTH)
+    except Exception:
+        return ""
+    os.makedirs(os.path.join(out_dir, "assets"), exist_ok=True)
+    written.append(os.path.join(out_dir, "assets", os.path.basename(thumb)))
+    shutil.copy2(thumb, written[-1])
+    return f'<img src="assets/{os.path.basename(thumb)}" width="180" alt="">'
+
+
+def _plotly_js(mode: str, out_dir: str, written: list) -> str:
+    """Script src for plotly.js: a copy next to the page ("copy") or the versioned CDN build ("cdn")."""
+    from plotly.offline import get_plotlyjs_version
+
+    version = get_plotlyjs_version()
+    if mode == "cdn":
+        return f"https://cdn.plot.ly/plotly-{version}.min.js"
+    import plotly
+
+    name = f"plotly-{version}.min.js"
+    written.append(os.path.join(out_dir, name))
+    shutil.copy2(os.path.join(os.path.dirname(plotly.__file__), "package_data", "plotly.min.js"), written[-1])
+    return name
+
+
+def render_page(model: PortfolioModel, out_dir: str, live_url: str = "", image_path: str = "",
+                plotly_js: str = "copy"):
+    """
+    Write index.html (and its assets) for `model` into `out_dir`; returns the
+    chart data and the paths written. Other files already in `out_dir` are left alone.
+    """
+    from charts import THEME
+
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    data = chart_data(model, THEME)
+    fragments = PageFragments(model.about, gdrive_direct_url(model.resume_link), model.projects,
+                              model.certifications)
+    contact = "\n".join(f"<p><strong>{label}:</strong> {html.escape(str(model.contact.get(key, '')))}</p>"
+                        for label, key in (("Email", "email"), ("GitHub", "github"), ("LinkedIn", "linkedin"),
+                                           ("Mobile", "phone")))
+    live_note = ""
+    if live_url:
+        url = html.escape(live_url, quote=True)
+        live_note = (f'<p class="caption">Monte Carlo forecast ranges and other profiles need the '
+                     f'<a href="{url}">live dashboard</a>.</p>')
+    page = PAGE.substitute(
+        title=html.escape(f"{model.name} — Future Skills Portfolio"), plotly_src=_plotly_js(plotly_js, out_dir, written),
+        image=_profile_image(model, image_path, out_dir, written), name=html.escape(model.name),
+        headline=html.escape(model.headline), about=fragments.about, contact=contact, resume=fragments.resume,
+        n_projects=len(model.projects), n_certifications=len(model.certifications),
+        years_min=YEARS_MIN, years_max=YEARS_MAX, years_step=YEARS_STEP, live_note=live_note,
+        topn_min=min(3, len(model.skills)), topn_max=len(model.skills),
+        topn_default=min(TOP_N_DEFAULT, len(model.skills)),
+        projects=_project_cards(model, fragments.projects), certifications=fragments.certifications,
+        generated=time.strftime("%Y-%m-%d"),
+        # "</" cannot appear inside the data script element
+        data=json.dumps(data, separators=(",", ":"), ensure_ascii=False).replace("</", "<\\/"),
+        script=SCRIPT)
+    written.append(os.path.join(out_dir, "index.html"))
+    with open(written[-1], "w", encoding="utf-8") as fh:
+        fh.write(page)
+    return data, written
+
+
+def export_report(out_dir: str, data: dict, written, build_ms: float) -> dict:
+    """Build time, sizes (raw and gzip) of the files this build wrote and how many chart states the data covers."""
+    files = {}
+    for path in written:
+        with open(path, "rb") as fh:
+            raw = fh.read()
+        files[os.path.relpath(path, out_dir)] = {"bytes": len(raw), "gzip_bytes": len(gzip.compress(raw))}
+    n_years, n_skills = len(data["years"]), len(data["skills"])
+    data_json = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return {
+        "build_ms": round(build_ms, 1),
+        "states": n_years * max(n_skills - 2, 1),
+        "unique_projection_rows": len(data["rows"]), "unique_orders": len(data["orders"]),
+        "chart_data_bytes": len(data_json),
+        "total_bytes": sum(f["bytes"] for f in files.values()),
+        "total_gzip_bytes": sum(f["gzip_bytes"] for f in files.values()),
+        "files": files,
+    }
+
+
+def load_model(store_root: str = None, profile_id: str = None, module: str = APP_PATH):
+    """(model, local image path) of a stored profile, or of the data embedded in `module`."""
+    if store_root and profile_id:
+        return PortfolioModel.from_profile(ProfileStore(store_root).load(profile_id)), ""
+    values = read_data_module(module)
+    image = values.get("PROFILE_IMG_PATH", "")
+    return PortfolioModel.from_profile(profile_from_module(values)), os.path.join(os.path.dirname(module), image)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the dashboard as a static site.")
+    parser.add_argument("--out", default=os.path.join(ROOT, "site"))
+    parser.add_argument("--module", default=APP_PATH, help="data module with the embedded profile (app.py / data.py)")
+    parser.add_argument("--store", help="profile store directory (with --profile)")
+    parser.add_argument("--profile", help="stored profile id to export instead of the embedded data")
+    parser.add_argument("--live-url", default=os.environ.get("PORTFOLIO_LIVE_URL", ""),
+                        help="live app linked for server-only features")
+    parser.add_argument("--plotly-js", choices=("copy", "cdn"), default="copy")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    model, image = load_model(args.store, args.profile, args.module)
+    data, written = render_page(model, args.out, args.live_url, image, args.plotly_js)
+    report = export_report(args.out, data, written, (time.perf_counter() - t0) * 1000)
+    with open(os.path.join(args.out, "export.json"), "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"exported {report['states']} chart states ({report['unique_projection_rows']} unique projection rows) "
+          f"in {report['build_ms']:.0f} ms", file=sys.stderr)
+    for name, f in sorted(report["files"].items()):
+        print(f"  {name}: {f['bytes'] / 1024:.1f} KiB ({f['gzip_bytes'] / 1024:.1f} KiB gzip)", file=sys.stderr)
+    print(args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+# forecast.py
+# Monte Carlo skill forecasts. Instead of one deterministic curve per skill,
+# the growth parameters (k, p, max of the data.py schema) are drawn from
+# configurable distributions and every skill is evaluated for all samples in
+# one float32 NumPy pass per chunk of skills. Levels are bounded to 0-100, so
+# percentiles come from a per-skill histogram at display resolution (0.1)
+# rather than a sort of every sample.
+#
+# Each sample is one learner: its parameter draws are shared by all skills, so
+# a sample's average level across skills (the fan chart) is meaningful too.
+#
+#   python forecast.py bench --skills 100 --samples 50000
+#   python forecast.py bench --skills 2000 --workers 4
+
+import argparse
+import functools
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from projection import SkillMatrix
+
+# parameter -> (distribution, spread). lognormal scales the value by exp(spread * z),
+# normal adds spread * z, uniform scales it by up to +/- spread (relative).
+SPREADS = {"k": ("lognormal", 0.25), "p": ("lognormal", 0.10), "max": ("normal", 5.0)}
+PERCENTILES = (10, 50, 90)
+SAMPLES = 50_000
+FAN_SAMPLES = 10_000  # the fan chart only needs the mean across skills, which converges faster
+SEED = 0
+CHUNK = 8             # skills per pass; keeps the (chunk, samples) working set in cache
+RESOLUTION = 0.1      # histogram bin width in level points (levels are shown to one decimal)
+_BINS = int(round(100 / RESOLUTION)) + 1
+POOL_MIN_SKILLS = 1000  # below this, starting a process pool costs more than it saves
+
+
+def draw_noise(samples: int, seed: int, spreads=SPREADS) -> dict:
+    """
+    param -> (scale, shift): float32 arrays of length `samples`, or None where
+    the distribution has no such term. A draw is value * scale + shift.
+    """
+    return _noise(samples, seed, tuple(sorted(spreads.items())))
+
+
+@functools.lru_cache(maxsize=4)
+def _noise(samples: int, seed: int, spreads: tuple) -> dict:
+    spreads = dict(spreads)
+    rng = np.random.default_rng(seed)
+    noise = {}
+    for name in ("k", "p", "max"):
+        kind, spread = spreads.get(name, ("normal", 0.0))
+        spread = np.float32(spread)
+        if kind == "lognormal":
+            noise[name] = (np.exp(spread * rng.standard_normal(samples, dtype=np.float32)), None)
+        elif kind == "normal":
+            noise[name] = (None, spread * rng.standard_normal(samples, dtype=np.float32))
+        elif kind == "uniform":
+            if not 0 <= spread < 1:
+                raise ValueError(f"uniform spread for {name} must be in [0, 1), got {spread}")
+            noise[name] = (1 + spread * (2 * rng.random(samples, dtype=np.float32) - 1), None)
+        else:
+            raise ValueError(f"unknown distribution {kind!r} for {name}")
+    return noise
+
+
+def _sample(col, noise, floor):
+    """(c, samples) draws of a (c, 1) parameter column, at least `floor`."""
+    scale, shift = noise
+    out = col * scale if scale is not None else np.repeat(col, len(shift), axis=1)
+    if shift is not None:
+        out += shift
+        np.maximum(out, floor, out=out)  # only an additive term can cross zero
+    return out
+
+
+def _chunk_bands(job):
+    """(bands (m, 3, c), per-sample level sums (m, samples)) for one chunk of skills; pool worker."""
+    (base, max_, k, p), years, samples, seed, spreads, skill_bands = job
+    noise = draw_noise(samples, seed, spreads)
+    c = len(base)
+    base, max_, k, p = (np.asarray(col, dtype=np.float32)[:, None] for col in (base, max_, k, p))
+    base = np.clip(base, 0, 100)
+    k = _sample(k, noise["k"], np.float32(1e-6))
+    np.negative(k, out=k)
+    p = _sample(p, noise["p"], np.float32(1e-6))
+    top = _sample(max_, noise["max"], np.float32(0))
+    np.clip(top, base, np.float32(100), out=top)
+    # Work in histogram units: level / RESOLUTION + 0.5 (so truncation rounds), shifted by
+    # the chunk row's bin offset so one bincount covers every skill of the chunk.
+    scale = np.float32(1 / RESOLUTION)
+    top -= base
+    gain = np.multiply(top, scale, out=top)
+    offsets = (np.arange(c, dtype=np.float32) * _BINS)[:, None]
+    origin = base * scale + np.float32(0.5) + offsets
+    bias = c * 0.5 + float(offsets.sum())
+    targets = np.asarray(PERCENTILES, dtype=np.float64) / 100 * samples
+    bands = np.empty((len(years), len(PERCENTILES), c), dtype=np.float32)
+    sums = np.empty((len(years), samples), dtype=np.float64)
+    level = np.empty((c, samples), dtype=np.float32)
+    for i, t in enumerate(years):
+        np.multiply(k, np.float32(t), out=level)
+        np.expm1(level, out=level)
+        np.negative(level, out=level)
+        np.power(level, p, out=level)
+        level *= gain
+        level += origin
+        # back to level points: undo the unit change, the rounding half and the offsets
+        sums[i] = (level.sum(axis=0) - bias) / scale
+        if skill_bands:
+            counts = np.bincount(level.astype(np.int32).ravel(), minlength=c * _BINS).reshape(c, _BINS).cumsum(axis=1)
+            # nearest-rank percentile: first bin whose cumulative count reaches the target
+            bands[i] = ((counts[:, None, :] < targets[:, None]).sum(axis=2) * RESOLUTION).T
+    return bands, sums
+
+
+def default_workers(n_skills: int) -> int:
+    """Process pool size for a forecast over `n_skills` (0 = in-process)."""
+    cpus = os.cpu_count() or 1
+    return min(cpus, 8) if cpus > 1 and n_skills >= POOL_MIN_SKILLS else 0
+
+
+class Forecast:
+    """Percentile bands of a Monte Carlo projection over a grid of years."""
+
+    def __init__(self, matrix: SkillMatrix, years, samples: int = SAMPLES, seed: int = SEED, spreads=SPREADS,
+                 workers=None, chunk: int = CHUNK, skill_bands: bool = True):
+        self.years = np.atleast_1d(np.asarray(years, dtype=np.float64))
+        self.samples, self.seed = samples, seed
+        n = len(matrix)
+        workers = default_workers(n) if workers is None else workers
+        cols = (matrix.base, matrix.max, matrix.k, matrix.p)
+        jobs = [(tuple(col[a:a + chunk] for col in cols), self.years, samples, seed, spreads, skill_bands)
+                for a in range(0, n, chunk)]
+        if workers and len(jobs) > 1:
+            # spawn, not fork: forking a threaded process (e.g. a Streamlit server) can deadlock the children
+            with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                results = list(pool.map(_chunk_bands, jobs, chunksize=-(-len(jobs) // workers)))
+        else:
+            results = [_chunk_bands(job) for job in jobs]
+        m = len(self.years)
+        # (years, percentile, skill); only filled when skill_bands
+        self.bands = (np.concatenate([r[0] for r in results], axis=2) if results
+                      else np.empty((m, len(PERCENTILES), 0), dtype=np.float32))
+        means = sum(r[1] for r in results) / n if n else np.zeros((m, samples))
+        # (years, percentile) of each sample's average level across skills
+        self.mean_bands = np.percentile(means, PERCENTILES, axis=1).T
+
+    def at(self, years: float) -> np.ndarray:
+        """(3, n_skills) P10/P50/P90 levels at the grid year nearest `years`."""
+        return self.bands[int(np.abs(self.years - years).argmin())]
+
+
+# -------------------------
+# CLI
+# -------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo skill forecasts.")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_bench = sub.add_parser("bench", help="time one forecast over synthetic skills")
+    p_bench.add_argument("--skills", type=int, default=100)
+    p_bench.add_argument("--samples", type=int, default=SAMPLES)
+    p_bench.add_argument("--years", type=float, nargs="+", default=[3.0])
+    p_bench.add_argument("--workers", type=int, default=0, help="process pool size (0 = in-process)")
+    p_bench.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    base = rng.uniform(10, 80, args.skills)
+    matrix = SkillMatrix([f"Skill {i}" for i in range(args.skills)], base,
+                         np.minimum(100, base + rng.uniform(5, 40, args.skills)), rng.uniform(0.3, 0.7, args.skills),
+                         rng.uniform(1.0, 1.4, args.skills), np.zeros(args.skills), ["ML"])
+    times = []
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        Forecast(matrix, args.years, samples=args.samples, workers=args.workers)
+        times.append((time.perf_counter() - t0) * 1000)
+    times.sort()
+    print(f"{args.skills} skills x {args.samples} samples x {len(args.years)} years "
+          f"(workers={args.workers}, cpus={os.cpu_count()}): best {times[0]:.1f} ms, median {times[len(times) // 2]:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
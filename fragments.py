@@ -0,0 +1,102 @@
+# fragments.py
+# Pre-rendered HTML for the static page fragments: the about box, the resume
+# button, project cards and the certifications grid. Templates are compiled
+# once at import; values are HTML-escaped when a fragment is built, and built
+# fragments are memoized by the content hash of (template, values) in a
+# process-wide LRU, so a rerun only looks the finished strings up and a data
+# change rebuilds just the fragments whose content changed.
+
+import html
+from string import Template
+
+from lru import LRUCache
+from model import data_version
+
+# Streamlit renders these through Markdown (CommonMark), where a blank or
+# whitespace-only line ends an HTML block and a line indented four spaces
+# becomes a code block. So no template line is indented or holds only a
+# placeholder, and values have their whitespace runs collapsed (a no-op in
+# HTML) so a multi-line value cannot end the block either.
+TEMPLATES = {
+    "about": Template("""<div style="background: rgba(255,255,255,0.03); border: 1px solid rgba(255,255,255,0.04); padding: 10px; border-radius: 8px;">
+<p style="color:#d7dff9;margin:0;">$about</p>
+</div>"""),
+    "resume_button": Template("""<div style="display:flex;justify-content:flex-end;">
+<a href="$href" target="_blank" style="background: linear-gradient(90deg,#7b2ff7,#2b86f9); color: white; padding: 10px 18px; border-radius: 10px; text-decoration: none; font-weight: 600; box-shadow: 0 6px 18px rgba(43,134,249,0.22);">$label</a>
+</div>"""),
+    "project_card": Template("""<div style="background: linear-gradient(135deg, rgba(43,134,249,0.04), rgba(123,47,247,0.03)); border: 1px solid rgba(255,255,255,0.03); padding:12px; border-radius:10px; margin-bottom:10px;">
+<div style="display:flex;justify-content:space-between;align-items:center;">
+<div style="font-weight:700;color:#e6e6ff;padding:8px 12px;border-radius:8px;background:rgba(0,0,0,0.18);">$title</div>
+<div style="color:#aab6ff;font-size:13px;">Tech: $tech</div>
+</div>
+<div style="margin-top:8px;color:#d7dff9;">$short_description</div>
+</div>"""),
+    "certification": Template("""<div>
+<p style="font-weight:700;margin:0;">$name</p>$issuer_line
+<p style="color:rgba(250,250,250,0.6);font-size:14px;margin:0 0 12px;">$date</p>
+</div>"""),
+    "issuer": Template("""<p style="margin:0;">$issuer</p>"""),
+    "certifications": Template("""<div style="display:grid;grid-template-columns:repeat(3,1fr);gap:8px 24px;">$items</div>"""),
+}
+# Values already rendered by another template; everything else is escaped.
+RAW_FIELDS = {"items", "issuer_line"}
+
+
+class FragmentRenderer:
+    """Escaped template rendering, memoized by content hash; `cache.stats()` has the hit/miss counts."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.cache = LRUCache(maxsize)
+
+    def render(self, template: str, **values) -> str:
+        key = (template, data_version(values))
+        return self.cache.get_or_build(key, lambda: self._build(template, values))
+
+    @staticmethod
+    def _build(template: str, values: dict) -> str:
+        escaped = {k: v if k in RAW_FIELDS else html.escape(" ".join(str(v).split())) for k, v in values.items()}
+        return TEMPLATES[template].substitute(escaped)
+
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+
+RENDERER = FragmentRenderer()
+
+
+# -------------------------
+# The page's fragments for one data model
+# -------------------------
+def about_box(about: str) -> str:
+    return RENDERER.render("about", about=about)
+
+
+def resume_button(link: str, label: str = "Download Resume (PDF)") -> str:
+    return RENDERER.render("resume_button", href=link, label=label) if link else ""
+
+
+def project_card(project) -> str:
+    return RENDERER.render("project_card", title=project.get("title", ""),
+                           tech=", ".join(project.get("tech", [])),
+                           short_description=project.get("short_description", ""))
+
+
+def certification(cert) -> str:
+    issuer = RENDERER.render("issuer", issuer=cert.get("issuer")) if cert.get("issuer") else ""
+    return RENDERER.render("certification", name=cert.get("name", ""), issuer_line=issuer, date=cert.get("date", ""))
+
+
+def certifications_grid(certs) -> str:
+    return RENDERER.render("certifications", items="\n".join(certification(c) for c in certs))
+
+
+class PageFragments:
+    """Every static fragment of one data model, built once and shared by all sessions."""
+
+    __slots__ = ("about", "resume", "projects", "certifications")
+
+    def __init__(self, about: str, resume_link: str, projects, certifications):
+        self.about = about_box(about)
+        self.resume = resume_button(resume_link)
+        self.projects = tuple(project_card(p) for p in projects)
+        self.certifications = certifications_grid(certifications)
@@ -0,0 +1,57 @@
+# lru.py
+# Thread-safe bounded LRU map used by the per-version artifact cache
+# (cache.py), the HTML fragment cache (fragments.py) and the rule engine's
+# aggregate cache (rules.py). It needs no numpy, so the fragments rendered
+# in the profile column do not load it before the first paint.
+
+import threading
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe bounded LRU map with hit/miss counters."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key, default=None):
+        """Cached value for `key` (counted as a hit) or `default` (counted as a miss)."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_build(self, key, build):
+        """Return the cached value for `key`, calling `build()` and storing it on a miss."""
+        value = self.lookup(key, _MISSING)
+        if value is _MISSING:
+            value = build()
+            self.put(key, value)
+        return value
+
+    def items(self) -> list:
+        """Snapshot of the (key, value) pairs, least recently used first; does not count as hits."""
+        with self._lock:
+            return list(self._data.items())
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self) -> dict:
+        return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,202 @@
+# model.py
+# Read-only portfolio data model shared by every session. Skills, projects,
+# certifications and roles are __slots__ records (no per-instance __dict__),
+# repeated short strings (skill names, areas, tech tags, issuers) are interned,
+# and the app keeps one PortfolioModel per data version in st.cache_resource,
+# so a session holds references to shared records instead of its own nested
+# dicts. Records answer .get()/[] with the same keys as the data dicts, so
+# code written against the data.py / app.py schemas reads them unchanged.
+# Nothing here needs numpy: the app builds its model at module top, before
+# the first paint, and numpy loads only when a chart section needs it.
+
+import ast
+import hashlib
+import json
+import sys
+from types import MappingProxyType
+
+_MISSING = object()
+
+# app.py schema ({"level", "area"}) has no curve parameters of its own, so the
+# per-area target gain and speed used by the original Skill Projection block
+# are applied here. data.py schema ({"base", "max", "k", "p", "category"})
+# carries its own parameters and is used as-is.
+AREA_CURVES = {
+    "ML": {"gain": 30, "k": 0.6},
+    "DevOps": {"gain": 40, "k": 0.5},
+}
+DEFAULT_CURVE = {"gain": 20, "k": 0.45}
+
+
+def data_version(*parts) -> str:
+    """Content hash of the portfolio data (e.g. SKILLS, PROJECTS); changes whenever the data does."""
+    payload = json.dumps(parts, sort_keys=True, default=_jsonable, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _jsonable(value):
+    return value.as_dict() if isinstance(value, Record) else str(value)
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def skill_params(meta: dict):
+    """Normalize one skill entry from either schema to (base, max, k, p, category)."""
+    if "base" in meta:
+        base = float(meta["base"])
+        return (base, float(meta.get("max", 100)), float(meta.get("k", DEFAULT_CURVE["k"])),
+                float(meta.get("p", 1.0)), meta.get("category") or meta.get("area") or "")
+    base = float(meta.get("level", 0))
+    area = meta.get("area") or meta.get("category") or ""
+    curve = AREA_CURVES.get(area, DEFAULT_CURVE)
+    return base, min(100.0, base + curve["gain"]), curve["k"], 1.0, area
+
+
+class Record:
+    """Immutable slotted record with dict-style read access; a key is present when its value is not None."""
+
+    __slots__ = ()
+    ALIASES = {}
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values.get(name))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def get(self, key, default=None):
+        key = self.ALIASES.get(key, key)
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__ if getattr(self, name) is not None}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+
+class Skill(Record):
+    """Normalized curve parameters; "level"/"area" (app.py schema) alias "base"/"category"."""
+
+    __slots__ = ("name", "base", "max", "k", "p", "category")
+    ALIASES = {"level": "base", "area": "category"}
+
+
+class Project(Record):
+    __slots__ = ("title", "short_description", "long_description", "tech", "link")
+
+
+class Certification(Record):
+    __slots__ = ("name", "issuer", "date")
+
+
+class Role(Record):
+    """Experience entry: "start"/"end" dates, or the legacy "exp" years ending at "date"."""
+
+    __slots__ = ("label", "start", "end", "exp", "date")
+
+
+class PortfolioModel:
+    """One profile's data as shared read-only records; build with from_profile()."""
+
+    __slots__ = ("version", "name", "headline", "about", "contact", "resume_link", "image_link",
+                 "skills", "projects", "certifications", "experience", "_matrix")
+
+    @classmethod
+    def from_profile(cls, profile: dict, version: str = None) -> "PortfolioModel":
+        """
+        Build from a profile dict in the store.py schema (store.load() or
+        profile_from_module()); a "skill_matrix" already loaded by the
+        store is reused instead of being rebuilt.
+        """
+        model = cls()
+        model.version = version or profile_version(profile)
+        model.name = profile.get("name", "")
+        model.headline = profile.get("headline", "")
+        model.about = profile.get("about", "")
+        model.contact = MappingProxyType({_intern(k): v for k, v in (profile.get("contact") or {}).items()})
+        model.resume_link = profile.get("resume_link", "")
+        model.image_link = profile.get("image_link", "")
+        skills = {}
+        for name, meta in (profile.get("skills") or {}).items():
+            base, max_, k, p, category = skill_params(meta)
+            name = sys.intern(name)
+            skills[name] = Skill(name=name, base=base, max=max_, k=k, p=p, category=sys.intern(category))
+        model.skills = MappingProxyType(skills)
+        model.projects = tuple(
+            Project(title=p.get("title", ""), short_description=p.get("short_description", ""),
+                    long_description=p.get("long_description", ""), link=p.get("link", ""),
+                    tech=tuple(sys.intern(t) for t in p.get("tech", ())))
+            for p in profile.get("projects") or ())
+        model.certifications = tuple(
+            Certification(name=c.get("name", ""), issuer=_intern(c.get("issuer", "")), date=_intern(c.get("date", "")))
+            for c in profile.get("certifications") or ())
+        model.experience = tuple(Role(**{k: _intern(v) for k, v in e.items() if k in Role.__slots__})
+                                 for e in profile.get("experience") or ())
+        model._matrix = profile.get("skill_matrix")
+        return model
+
+    @property
+    def skill_matrix(self):
+        """Column-wise SkillMatrix of the skills, built on first use (numpy is not needed before that)."""
+        if self._matrix is None:
+            from projection import SkillMatrix
+            self._matrix = SkillMatrix.from_items(self.skills.items())
+        return self._matrix
+
+
+def profile_version(profile: dict) -> str:
+    """data_version of everything a PortfolioModel is built from."""
+    return data_version(*(profile.get(key) for key in ("name", "headline", "about", "contact", "resume_link",
+                                                       "image_link", "skills", "projects", "certifications",
+                                                       "experience")))
+
+
+# -------------------------
+# Reading profile data out of the Python data modules
+# -------------------------
+def read_data_module(path: str) -> dict:
+    """
+    Module-level literal assignments (SKILLS, PROJECTS, ...) of a data file such
+    as data.py or app.py, read with ast.literal_eval so nothing is executed.
+    """
+    with open(path, encoding="utf-8") as fh:
+        tree = ast.parse(fh.read(), filename=path)
+    values = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            try:
+                values[node.targets[0].id] = ast.literal_eval(node.value)
+            except ValueError:
+                pass  # computed values (function calls etc.) are not data
+    return values
+
+
+def profile_from_module(values: dict) -> dict:
+    """Normalize the constants of app.py or data.py into one store profile dict."""
+    contact = dict(values.get("CONTACT") or values.get("PROFILE") or {})
+    return {
+        "name": values.get("NAME") or contact.pop("name", ""),
+        "headline": values.get("HEADLINE", ""),
+        "about": values.get("ABOUT_TEXT", ""),
+        "contact": contact,
+        "resume_link": values.get("RESUME_SHARE", ""),
+        "image_link": values.get("PROFILE_IMG_SHARE", ""),
+        "skills": values.get("SKILLS", {}),
+        "projects": values.get("PROJECTS", []),
+        "certifications": values.get("CERTIFICATIONS", []),
+        "experience": values.get("EXPERIENCE", []),
+    }
@@ -0,0 +1,205 @@
+# profiling.py
+# Rerun profiler. Each page section is wrapped in `profiler.section(name)`,
+# which records wall time, the session thread's CPU time, peak allocated
+# memory and the bytes of forward messages the section sent to the browser. A rerun's record is
+# appended to a rotating JSONL log and, behind ?debug=profile, shown in an
+# in-app overlay. Only a sampled fraction of reruns is measured
+# (PORTFOLIO_PROFILE_SAMPLE, default 1%); unsampled reruns pay one random() call.
+
+import json
+import logging
+import logging.handlers
+import os
+import random
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+
+SAMPLE_RATE = float(os.environ.get("PORTFOLIO_PROFILE_SAMPLE", "0.01"))
+LOG_PATH = os.environ.get("PORTFOLIO_PROFILE_LOG", os.path.join("logs", "rerun_profile.jsonl"))
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUPS = 5
+
+_logger = None
+_logger_lock = threading.Lock()
+
+# tracemalloc is process-wide while sessions are threads: it runs while any
+# sampled section is open, and only a thread measuring alone may reset the peak
+_tracing_lock = threading.Lock()
+_tracing_users = {}  # thread id -> open sampled sections
+_tracing_owned = False
+
+
+def _acquire_tracing() -> bool:
+    """Register an open section on this thread; True if no other thread is measuring."""
+    global _tracing_owned
+    with _tracing_lock:
+        if not _tracing_users and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing_owned = True
+        tid = threading.get_ident()
+        _tracing_users[tid] = _tracing_users.get(tid, 0) + 1
+        return len(_tracing_users) == 1
+
+
+def _release_tracing() -> bool:
+    """Close a section on this thread (stopping tracing after the last one); True if it measured alone."""
+    global _tracing_owned
+    with _tracing_lock:
+        alone = len(_tracing_users) == 1
+        tid = threading.get_ident()
+        _tracing_users[tid] -= 1
+        if not _tracing_users[tid]:
+            del _tracing_users[tid]
+        if not _tracing_users and _tracing_owned:
+            tracemalloc.stop()
+            _tracing_owned = False
+        return alone
+
+
+def _reset_peak_if_alone():
+    with _tracing_lock:
+        if list(_tracing_users) == [threading.get_ident()]:
+            tracemalloc.reset_peak()
+
+
+def _profile_logger() -> logging.Logger:
+    """JSONL logger with size-based rotation, created on first sampled rerun."""
+    global _logger
+    with _logger_lock:
+        if _logger is None:
+            os.makedirs(os.path.dirname(LOG_PATH) or ".", exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(LOG_PATH, maxBytes=LOG_MAX_BYTES,
+                                                           backupCount=LOG_BACKUPS, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger = logging.getLogger("portfolio.rerun_profile")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            logger.addHandler(handler)
+            _logger = logger
+    return _logger
+
+
+@contextmanager
+def _count_payload(counter: list):
+    """Add the serialized size of every ForwardMsg sent inside the block to counter[0]."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx(suppress_warning=True)
+    except Exception:
+        ctx = None
+    if ctx is None:
+        yield
+        return
+    original = ctx._enqueue
+
+    def counting(msg):
+        counter[0] += msg.ByteSize()
+        original(msg)
+
+    ctx._enqueue = counting
+    try:
+        yield
+    finally:
+        ctx._enqueue = original
+
+
+class RerunProfiler:
+    """Per-rerun section timings; a no-op unless this rerun was sampled (or forced)."""
+
+    def __init__(self, session_id: str = "", force: bool = False, sample_rate: float = SAMPLE_RATE):
+        self.session_id = session_id
+        self.force = force
+        self.sample_rate = sample_rate
+        self.enabled = self._sample()
+        self.sections = {}
+        self.finished = False
+        self._stack = []
+        self._started = time.perf_counter()
+
+    def _sample(self) -> bool:
+        return self.force or (self.sample_rate > 0 and random.random() < self.sample_rate)
+
+    @contextmanager
+    def section(self, name: str):
+        if self.finished and not self._stack:
+            # fragment rerun after the full-page record was written: sampled on its own
+            self.enabled = self._sample()
+            self.sections = {}
+        if not self.enabled:
+            yield
+            return
+        alone = _acquire_tracing()
+        frame = {"peak": 0}
+        self._stack.append(frame)
+        payload = [0]
+        mem_start = tracemalloc.get_traced_memory()[0]
+        _reset_peak_if_alone()
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            with _count_payload(payload):
+                yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+            peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+            self._stack.pop()
+            if self._stack:
+                # nested section: hand the peak up and restart tracking for the parent
+                self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+                _reset_peak_if_alone()
+            alone = _release_tracing() and alone
+            self.sections[name] = {
+                "wall_ms": round(wall * 1000, 3),
+                "cpu_ms": round(cpu * 1000, 3),
+                "alloc_peak_kb": round(max(0, peak - mem_start) / 1024, 1),
+                # another session measured at the same time: the peak includes its allocations
+                "alloc_shared": not alone,
+                "payload_bytes": payload[0],
+            }
+            if self.finished and not self._stack:
+                # every section of the fragment rerun, nested ones included
+                self._emit(self.sections, kind="fragment")
+                self.sections = {}
+
+    def _emit(self, sections: dict, kind: str, total_ms=None):
+        record = {"ts": round(time.time(), 3), "session": self.session_id, "kind": kind, "sections": sections}
+        if total_ms is not None:
+            record["total_ms"] = total_ms
+        _profile_logger().info(json.dumps(record))
+        return record
+
+    def finish(self):
+        """Write this rerun's record; later (fragment) sections are logged individually."""
+        if not self.enabled or self.finished:
+            self.finished = True
+            return None
+        self.finished = True
+        return self._emit(dict(self.sections), kind="full",
+                          total_ms=round((time.perf_counter() - self._started) * 1000, 3))
+
+
+# -------------------------
+# Streamlit session glue
+# -------------------------
+_DISABLED = RerunProfiler(sample_rate=0.0)
+
+
+def begin_rerun(force: bool = False) -> RerunProfiler:
+    """Start profiling a full-page run; the profiler is kept in session state for fragment reruns."""
+    import streamlit as st
+
+    session_id = st.session_state.setdefault("_profile_session", uuid.uuid4().hex[:12])
+    profiler = RerunProfiler(session_id, force=force)
+    st.session_state["_rerun_profiler"] = profiler
+    return profiler
+
+
+def current_profiler() -> RerunProfiler:
+    """Profiler of the session's latest full-page run (a disabled one outside Streamlit)."""
+    try:
+        import streamlit as st
+        return st.session_state.get("_rerun_profiler", _DISABLED)
+    except Exception:
+        return _DISABLED
@@ -0,0 +1,72 @@
+# projection.py
+# Vectorized skill projection: every skill is evaluated over a whole grid of
+# years in a single NumPy broadcast instead of one math.exp call per skill.
+
+import numpy as np
+
+from model import AREA_CURVES, DEFAULT_CURVE, skill_params  # noqa: F401  (curve parameters live with the model)
+
+# Slider grid used by the dashboard ("Total professional experience (years)").
+YEARS_MIN = 1.0
+YEARS_MAX = 10.0
+YEARS_STEP = 0.25
+
+
+def slider_years():
+    """All legal values of the experience slider (1.0 to 10.0 by 0.25)."""
+    n = int(round((YEARS_MAX - YEARS_MIN) / YEARS_STEP)) + 1
+    return np.round(YEARS_MIN + YEARS_STEP * np.arange(n), 2)
+
+
+class SkillMatrix:
+    """Skills stored column-wise as NumPy arrays, one entry per skill."""
+
+    __slots__ = ("names", "base", "max", "k", "p", "category", "categories")
+
+    def __init__(self, names, base, max_, k, p, category, categories):
+        self.names = tuple(names)
+        self.base = np.asarray(base, dtype=np.float64)
+        self.max = np.asarray(max_, dtype=np.float64)
+        self.k = np.asarray(k, dtype=np.float64)
+        self.p = np.asarray(p, dtype=np.float64)
+        self.category = np.asarray(category, dtype=np.int32)
+        self.categories = tuple(categories)
+
+    @classmethod
+    def from_skills(cls, skills: dict) -> "SkillMatrix":
+        """Build from a SKILLS dict in either the app.py or the data.py schema."""
+        return cls.from_items(skills.items())
+
+    @classmethod
+    def from_items(cls, items) -> "SkillMatrix":
+        """Build from (name, meta) pairs; names need not be unique (e.g. several profiles stacked)."""
+        names, params = [], []
+        for name, meta in items:
+            names.append(name)
+            params.append(skill_params(meta))
+        categories = {}
+        codes = [categories.setdefault(row[4], len(categories)) for row in params]
+        base, max_, k, p = np.array([row[:4] for row in params], dtype=np.float64).reshape(len(params), 4).T
+        return cls(names, base, max_, k, p, codes, categories)
+
+    def __len__(self):
+        return len(self.names)
+
+    def take(self, idx) -> "SkillMatrix":
+        """The skills at positions `idx`, in that order."""
+        idx = np.asarray(idx, dtype=np.int64)
+        return SkillMatrix([self.names[i] for i in idx], self.base[idx], self.max[idx], self.k[idx], self.p[idx],
+                           self.category[idx], self.categories)
+
+    def areas(self):
+        """Category label for each skill, in skill order."""
+        return np.asarray(self.categories, dtype=object)[self.category] if len(self) else np.array([], dtype=object)
+
+    def project(self, years):
+        """
+        Predicted level of every skill at `years`.
+        A scalar returns shape (n_skills,); an array of shape (m,) returns (m, n_skills).
+        """
+        t = np.asarray(years, dtype=np.float64)
+        growth = -np.expm1(-self.k * t[..., None])
+        return self.base + (self.max - self.base) * np.power(growth, self.p)
@@ -0,0 +1,186 @@
+# rules.py
+# Declarative rule engine for the predicted-timeline heuristic. A rule table
+# (timeline_rules.json by default, PORTFOLIO_RULES to override) names the
+# features the rules read - per-area mean levels, single skill levels and
+# per-call inputs such as years of experience - and, for each milestone year,
+# ordered cases (first match wins) plus notes appended when their condition
+# holds. Conditions are compiled once into column comparisons over a
+# (rows, features) matrix, so a whole cohort of (profile, years) pairs is
+# evaluated in a few NumPy passes. Area aggregates are cached per skill set.
+
+import json
+import os
+import threading
+
+import numpy as np
+
+from core import skill_area, skill_level
+from lru import LRUCache
+from model import data_version
+
+RULES_PATH = os.environ.get("PORTFOLIO_RULES", os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                            "timeline_rules.json"))
+OPS = {"<": np.less, "<=": np.less_equal, ">": np.greater, ">=": np.greater_equal,
+       "==": np.equal, "!=": np.not_equal}
+FEATURE_KINDS = ("area_mean", "skill_level", "input")
+
+
+def _year_key(year: str):
+    value = float(year)
+    return int(value) if value.is_integer() else value
+
+
+class RuleEngine:
+    """
+    A compiled rule table; see timeline_rules.json for the format. `version`
+    is the table's content hash, so output cached from it can be keyed by it.
+    """
+
+    def __init__(self, table: dict, cache_size: int = 4096):
+        self.version = data_version(table)
+        self.features = tuple(table["features"])
+        columns = {name: i for i, name in enumerate(self.features)}
+        self._aggregate_specs = []  # (column, kind, argument) of features derived from the skills
+        self._inputs = []           # (column, input name)
+        for name, spec in table["features"].items():
+            (kind, arg), = spec.items()
+            if kind not in FEATURE_KINDS:
+                raise ValueError(f"feature {name!r}: unknown kind {kind!r} (expected one of {FEATURE_KINDS})")
+            if kind == "input":
+                self._inputs.append((columns[name], arg))
+            else:
+                self._aggregate_specs.append((columns[name], kind, arg))
+        self._aggregate_columns = [c for c, _, _ in self._aggregate_specs]
+
+        self.milestones = []  # (year, [(predicate, text)], [(predicate, text)])
+        for year, spec in sorted(table["milestones"].items(), key=lambda kv: float(kv[0])):
+            cases = [(self._compile(c.get("when", []), columns), c["text"]) for c in spec.get("cases", [])]
+            notes = [(self._compile(n.get("when", []), columns), n["text"]) for n in spec.get("notes", [])]
+            self.milestones.append((_year_key(year), cases, notes))
+        self.aggregate_cache = LRUCache(cache_size)
+
+    @classmethod
+    def from_file(cls, path: str = RULES_PATH) -> "RuleEngine":
+        with open(path, encoding="utf-8") as fh:
+            return cls(json.load(fh))
+
+    @staticmethod
+    def _compile(conditions, columns):
+        """Predicate F -> bool mask for an AND of [feature, op, value] conditions."""
+        checks = []
+        for feature, op, value in conditions:
+            if feature not in columns:
+                raise ValueError(f"condition on unknown feature {feature!r}")
+            if op not in OPS:
+                raise ValueError(f"unknown operator {op!r}")
+            checks.append((columns[feature], OPS[op], float(value)))
+
+        def predicate(F):
+            mask = np.ones(len(F), dtype=bool)
+            for col, op, value in checks:
+                mask &= op(F[:, col], value)
+            return mask
+        return predicate
+
+    # ---- features ----
+    @staticmethod
+    def skill_set_key(skills: dict) -> tuple:
+        """Hashable key of exactly what the aggregates read: (name, level, area) per skill."""
+        return tuple((name, skill_level(meta), skill_area(meta)) for name, meta in skills.items())
+
+    def aggregates(self, skill_sets) -> np.ndarray:
+        """(len(skill_sets), n_aggregate_features), cached per skill-set key."""
+        out = np.zeros((len(skill_sets), len(self._aggregate_specs)))
+        missing = {}
+        for i, skills in enumerate(skill_sets):
+            key = self.skill_set_key(skills)
+            row = self.aggregate_cache.lookup(key)
+            if row is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                out[i] = row
+        if missing:
+            for (key, idx), row in zip(missing.items(), self._compute_aggregates(list(missing))):
+                self.aggregate_cache.put(key, row)
+                out[idx] = row
+        return out
+
+    def _compute_aggregates(self, keys) -> np.ndarray:
+        """Aggregates of skill-set keys; area means via segment sums over every skill of every set at once."""
+        n = len(keys)
+        seg = np.repeat(np.arange(n), [len(k) for k in keys])
+        flat = [skill for key in keys for skill in key]
+        levels = np.asarray([level for _, level, _ in flat], dtype=np.float64)
+        codes = {}
+        area_codes = np.asarray([codes.setdefault(area, len(codes)) for _, _, area in flat], dtype=np.int64)
+        out = np.zeros((n, len(self._aggregate_specs)))
+        for k, (_, kind, arg) in enumerate(self._aggregate_specs):
+            if kind == "area_mean":
+                mask = area_codes == codes.get(arg, -1)
+                total = np.bincount(seg[mask], weights=levels[mask], minlength=n)
+                count = np.bincount(seg[mask], minlength=n)
+                out[:, k] = np.divide(total, count, out=np.zeros(n), where=count > 0)
+            else:
+                out[:, k] = [next((level for name, level, _ in key if name == arg), 0) for key in keys]
+        return out
+
+    @staticmethod
+    def _input(profile: dict, name: str):
+        if name == "n_projects":
+            return profile.get("n_projects", len(profile.get("projects", [])))
+        return profile.get(name, 0)
+
+    def feature_matrix(self, profiles, years) -> np.ndarray:
+        """(len(profiles), n_features) for aligned profiles and experience years."""
+        F = np.zeros((len(profiles), len(self.features)))
+        F[:, self._aggregate_columns] = self.aggregates([p.get("skills", {}) for p in profiles])
+        for col, name in self._inputs:
+            F[:, col] = years if name == "years" else [self._input(p, name) for p in profiles]
+        return F
+
+    # ---- evaluation ----
+    def evaluate(self, F: np.ndarray) -> list:
+        """One {year: text} dict per feature row."""
+        columns = []
+        for _, cases, notes in self.milestones:
+            # choice = first matching case (len(cases) if none); each note adds a bit
+            choice = np.full(len(F), len(cases), dtype=np.int64)
+            for i, (predicate, _) in reversed(list(enumerate(cases))):
+                choice[predicate(F)] = i
+            code = choice << len(notes)
+            for bit, (predicate, _) in enumerate(notes):
+                code |= predicate(F).astype(np.int64) << bit
+            texts = {}
+            for c in np.unique(code).tolist():
+                case = c >> len(notes)
+                texts[c] = (cases[case][1] if case < len(cases) else "") + "".join(
+                    text for bit, (_, text) in enumerate(notes) if c >> bit & 1)
+            columns.append([texts[c] for c in code.tolist()])
+        years = [year for year, _, _ in self.milestones]
+        return [dict(zip(years, row)) for row in zip(*columns)]
+
+    def evaluate_profiles(self, profiles, years) -> list:
+        """
+        Milestones for aligned (profile, years) pairs. Each profile is a dict with
+        "skills" (either schema) and "n_projects" or "projects"; `years` is a
+        scalar or one value per profile.
+        """
+        years = np.broadcast_to(np.asarray(years, dtype=np.float64), (len(profiles),))
+        return self.evaluate(self.feature_matrix(profiles, years))
+
+
+# -------------------------
+# Shared engine
+# -------------------------
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def default_engine(path: str = RULES_PATH) -> RuleEngine:
+    """Engine for the rule file at `path`, recompiled when the file changes."""
+    stamp = os.stat(path).st_mtime_ns
+    with _engines_lock:
+        cached = _engines.get(path)
+        if cached is None or cached[0] != stamp:
+            cached = _engines[path] = (stamp, RuleEngine.from_file(path))
+    return cached[1]
@@ -0,0 +1,95 @@
+# score.py
+# Headless batch scoring: streams profiles from JSONL through the projection
+# and predicted-timeline logic in core.py and writes one JSONL result per
+# input line, in input order. Chunks are scored on a process pool with a
+# bounded number of chunks in flight, so memory stays flat and a slow writer
+# throttles the reader.
+#
+#   python score.py profiles.jsonl -o scores.jsonl --years 1 3 5 --workers 8
+#   cat profiles.jsonl | python score.py - --years 2.5
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from core import MILESTONE_YEARS, score_batch
+
+
+def score_lines(lines: list, years) -> list:
+    """Worker entry point: parse one chunk of JSONL lines and return serialized result lines."""
+    profiles = [json.loads(line) for line in lines]
+    return [json.dumps(r, ensure_ascii=False) for r in score_batch(profiles, years)]
+
+
+def _chunks(lines, size: int):
+    lines = (line for line in lines if line.strip())
+    while True:
+        chunk = list(itertools.islice(lines, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run(src, dst, years, workers: int = 0, chunk_size: int = 1000, max_pending: int = 0) -> int:
+    """
+    Score every profile in `src` (an iterable of JSONL lines) into `dst`.
+    workers=0 scores in-process; otherwise at most `max_pending` chunks
+    (default 2 per worker) are queued before the oldest result is written.
+    Returns the number of profiles scored.
+    """
+    years = [float(y) for y in years]
+    written = 0
+    if workers == 0:
+        for chunk in _chunks(src, chunk_size):
+            for line in score_lines(chunk, years):
+                dst.write(line + "\n")
+            written += len(chunk)
+        return written
+
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunks(src, chunk_size):
+            if len(pending) >= max_pending:
+                written += _drain(pending.popleft(), dst)
+            pending.append(pool.submit(score_lines, chunk, years))
+        while pending:
+            written += _drain(pending.popleft(), dst)
+    return written
+
+
+def _drain(future, dst) -> int:
+    lines = future.result()
+    dst.write("\n".join(lines) + "\n")
+    return len(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score portfolio profiles from JSONL without the Streamlit UI.")
+    parser.add_argument("input", help="JSONL file of profiles ('-' for stdin); each line needs a 'skills' dict")
+    parser.add_argument("-o", "--output", default="-", help="JSONL output file ('-' for stdout)")
+    parser.add_argument("--years", type=float, nargs="+", default=list(MILESTONE_YEARS),
+                        help="experience years to project skills at")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="process pool size (0 = in-process)")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--max-pending", type=int, default=0, help="chunks in flight (default 2 per worker)")
+    args = parser.parse_args(argv)
+
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    dst = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        n = run(src, dst, args.years, args.workers, args.chunk_size, args.max_pending)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+    print(f"scored {n} profiles", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
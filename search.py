@@ -0,0 +1,93 @@
+# search.py
+# Project search. ProjectIndex is an inverted index over each project's title,
+# descriptions and tech list, weighted by TF-IDF (smoothed idf, l2-normalized
+# per project: the same weighting as scikit-learn's TfidfVectorizer defaults),
+# built once per data version. A query only touches the postings of its own
+# terms; the last term also matches as a prefix so results follow typing.
+
+import bisect
+import math
+import re
+from collections import Counter
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")  # keeps c++, c#, node.js, scikit.learn
+TITLE_WEIGHT = 2  # a title term counts as much as two description terms
+PAGE_SIZE = 10
+
+
+def tokenize(text: str) -> list:
+    return TOKEN_RE.findall(text.lower())
+
+
+class ProjectIndex:
+    """Inverted TF-IDF index over a project list; results are positions in that list."""
+
+    def __init__(self, projects, doc_terms=None):
+        self.size = len(projects)
+        self.by_tech = {}   # tech -> positions using it
+        self.doc_terms = list(doc_terms) if doc_terms is not None else [None] * self.size  # position -> term counts
+        for doc, proj in enumerate(projects):
+            tech = list(proj.get("tech", []))
+            for name in tech:
+                self.by_tech.setdefault(name, []).append(doc)
+            if self.doc_terms[doc] is None:
+                counts = Counter()
+                for _ in range(TITLE_WEIGHT):
+                    counts.update(tokenize(proj.get("title", "")))
+                for text in (proj.get("short_description", ""), proj.get("long_description", ""), " ".join(tech)):
+                    counts.update(tokenize(text))
+                self.doc_terms[doc] = counts
+        doc_terms = self.doc_terms
+
+        df = Counter(term for counts in doc_terms for term in counts)
+        self.idf = {term: math.log((1 + self.size) / (1 + n)) + 1 for term, n in df.items()}
+        self.postings = {}  # term -> {position: weight}
+        for doc, counts in enumerate(doc_terms):
+            weights = {term: tf * self.idf[term] for term, tf in counts.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for term, w in weights.items():
+                self.postings.setdefault(term, {})[doc] = w / norm
+        self.terms = sorted(self.postings)
+        self.techs = sorted(self.by_tech, key=str.lower)
+
+    def updated(self, projects, changed=()) -> "ProjectIndex":
+        """Index of `projects` that re-tokenizes only the positions in `changed` (and new ones); weights are recomputed."""
+        return ProjectIndex(projects, [self.doc_terms[i] if i < self.size and i not in changed else None
+                                       for i in range(len(projects))])
+
+    def _prefixed(self, prefix: str):
+        i = bisect.bisect_left(self.terms, prefix)
+        while i < len(self.terms) and self.terms[i].startswith(prefix):
+            yield self.terms[i]
+            i += 1
+
+    def search(self, query: str = "", techs=()) -> list:
+        """Positions matching every query term, best first; with an empty query, every (tech-filtered) project in list order."""
+        allowed = set().union(*(self.by_tech.get(t, ()) for t in techs)) if techs else None
+        terms = tokenize(query)
+        if not terms:
+            return [d for d in range(self.size) if allowed is None or d in allowed]
+        # the word still being typed (no trailing space) also matches longer terms
+        partial = terms[-1] if not query[-1:].isspace() else None
+        scores, matched = {}, Counter()
+        query_terms = Counter(terms)
+        for term, qtf in query_terms.items():
+            expanded = self._prefixed(term) if term == partial else (term,)
+            best = {}
+            for t in expanded:
+                for doc, w in self.postings.get(t, {}).items():
+                    best[doc] = max(best.get(doc, 0.0), qtf * self.idf[t] * w)
+            for doc, s in best.items():
+                scores[doc] = scores.get(doc, 0.0) + s
+                matched[doc] += 1
+        # every query term has to match; TF-IDF only orders the survivors
+        hits = [d for d in scores if matched[d] == len(query_terms) and (allowed is None or d in allowed)]
+        hits.sort(key=lambda d: (-scores[d], d))
+        return hits
+
+
+def page(results, number: int, size: int = PAGE_SIZE):
+    """(results on 1-based page `number`, clamped to the last page; page count)."""
+    pages = max(1, -(-len(results) // size))
+    number = min(max(1, int(number)), pages)
+    return results[(number - 1) * size:number * size], pages
@@ -0,0 +1,78 @@
+# sections.py
+# Page sections with declared widget dependencies. A section that declares
+# widgets runs as a Streamlit fragment, so interacting with a widget it creates
+# re-executes and re-sends only that section instead of the whole page. The
+# declarations are checked on every run: a section that creates a widget
+# missing from its SECTION_DEPS entry raises, so the map cannot drift from the
+# page.
+
+import fnmatch
+import functools
+import threading
+
+import streamlit as st
+
+from profiling import current_profiler
+
+# section name -> keys (fnmatch patterns) of the widgets it creates or reads
+SECTION_DEPS = {
+    "profile": (),
+    "kpis": (),
+    "growth": ("years", "animate", "forecast"),                # Skill Projection, Experience Growth, Predicted Timeline
+    "skill_charts": ("years", "animate", "forecast", "topn"),  # bar + radar (+ forecast band), nested inside "growth"
+    "projects": ("project_query", "project_tech", "project_page", "project_open_*"),
+    "certifications": (),
+}
+
+
+_open = threading.local()  # per session thread: widget keys created by the sections currently running
+
+
+def _widget_keys():
+    """User keys of the widgets created so far in this script run (None outside a Streamlit run)."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        from streamlit.runtime.state.common import user_key_from_element_id
+        ids = get_script_run_ctx(suppress_warning=True).shared.widget_ids_this_run.snapshot()
+    except Exception:
+        return None
+    return {key for key in map(user_key_from_element_id, ids) if key}
+
+
+def _check_widgets(name: str, created: set):
+    undeclared = sorted(k for k in created if not any(fnmatch.fnmatchcase(k, p) for p in SECTION_DEPS[name]))
+    if undeclared:
+        raise RuntimeError(f"section {name!r} creates widgets {undeclared} that are not in SECTION_DEPS[{name!r}]")
+
+
+def section(name: str):
+    """
+    Decorator for a page section. Sections with declared widgets become
+    fragments (rerun on their own when one of their widgets changes); static
+    sections only run on full page runs. Widgets created directly in the
+    section (not in a nested one) must match its declared keys. Every run of a
+    section is timed by the session's profiler.
+    """
+    deps = SECTION_DEPS[name]
+
+    def wrap(fn):
+        @functools.wraps(fn)
+        def run(*args, **kwargs):
+            stack = _open.__dict__.setdefault("stack", [])
+            before = _widget_keys()
+            nested = set()
+            stack.append(nested)
+            try:
+                with current_profiler().section(name):
+                    result = fn(*args, **kwargs)
+            finally:
+                stack.pop()
+            after = _widget_keys()
+            if before is not None and after is not None:
+                created = after - before
+                _check_widgets(name, created - nested)
+                if stack:
+                    stack[-1].update(created)
+            return result
+        return st.fragment(run) if deps else run
+    return wrap
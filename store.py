@@ -0,0 +1,269 @@
+# store.py
+# On-disk multi-profile store. Profile text, projects, certifications and
+# experience live in SQLite indexed by profile id; the numeric skill matrix
+# (base, max, k, p per skill) lives in one flat float64 file that is
+# memory-mapped, so loading a profile reads only that profile's rows and
+# process memory does not grow with the number of stored profiles.
+#
+#   python store.py import profiles/ app.py --id dhrubo
+#   python store.py synth profiles/ 5000 --skills 100 --projects 20
+#   python store.py bench profiles/ --samples 200
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from model import profile_from_module, read_data_module  # noqa: F401  (read without numpy, see model.py)
+from projection import SkillMatrix, skill_params
+from timeline import entry_range
+
+DB_NAME = "portfolio.sqlite"
+MATRIX_NAME = "skills.f64"
+MATRIX_COLUMNS = ("base", "max", "k", "p")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id TEXT PRIMARY KEY,
+    name TEXT, headline TEXT, about TEXT, contact TEXT,
+    resume_link TEXT, image_link TEXT,
+    skill_offset INTEGER NOT NULL, skill_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS skills (
+    profile_id TEXT NOT NULL, pos INTEGER NOT NULL, name TEXT, category TEXT,
+    PRIMARY KEY (profile_id, pos)
+);
+CREATE TABLE IF NOT EXISTS projects (
+    profile_id TEXT NOT NULL, pos INTEGER NOT NULL, title TEXT, short_description TEXT,
+    long_description TEXT, tech TEXT, link TEXT,
+    PRIMARY KEY (profile_id, pos)
+);
+CREATE TABLE IF NOT EXISTS certifications (
+    profile_id TEXT NOT NULL, pos INTEGER NOT NULL, name TEXT, issuer TEXT, date TEXT,
+    PRIMARY KEY (profile_id, pos)
+);
+CREATE TABLE IF NOT EXISTS experience (
+    profile_id TEXT NOT NULL, pos INTEGER NOT NULL, label TEXT, start TEXT, end_date TEXT,
+    PRIMARY KEY (profile_id, pos)
+);
+"""
+
+
+# -------------------------
+# Store
+# -------------------------
+class ProfileStore:
+    """SQLite + memory-mapped skill matrix store rooted at a directory."""
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self.db_path = os.path.join(root, DB_NAME)
+        self.matrix_path = os.path.join(root, MATRIX_NAME)
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.executescript(SCHEMA)
+        # one connection shared by every session thread; sqlite3 needs access serialized
+        self._lock = threading.RLock()
+        self._matrix = None
+        self._matrix_rows = -1
+
+    def close(self):
+        self._db.close()
+
+    # ---- writing ----
+    def _append_matrix(self, rows: np.ndarray) -> int:
+        """Append skill rows to the matrix file; returns the row offset they start at."""
+        offset = os.path.getsize(self.matrix_path) // (8 * len(MATRIX_COLUMNS)) if os.path.exists(self.matrix_path) else 0
+        with open(self.matrix_path, "ab") as fh:
+            fh.write(np.ascontiguousarray(rows, dtype="<f8").tobytes())
+        return offset
+
+    def write_profile(self, profile_id: str, profile: dict, commit: bool = True):
+        """Insert or replace one profile. A replaced profile's old matrix rows are left unreferenced."""
+        skills = profile.get("skills", {})
+        experience = profile.get("experience", [])
+        params = [skill_params(meta) for meta in skills.values()]
+        rows = np.array([p[:4] for p in params], dtype="<f8").reshape(len(params), len(MATRIX_COLUMNS))
+        offset = self._append_matrix(rows)
+        db = self._db
+        for table in ("profiles", "skills", "projects", "certifications", "experience"):
+            key = "id" if table == "profiles" else "profile_id"
+            db.execute(f"DELETE FROM {table} WHERE {key} = ?", (profile_id,))
+        db.execute(
+            "INSERT INTO profiles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (profile_id, profile.get("name", ""), profile.get("headline", ""), profile.get("about", ""),
+             json.dumps(profile.get("contact", {})), profile.get("resume_link", ""),
+             profile.get("image_link", ""), offset, len(params)),
+        )
+        db.executemany("INSERT INTO skills VALUES (?, ?, ?, ?)",
+                       [(profile_id, i, name, p[4]) for i, (name, p) in enumerate(zip(skills, params))])
+        db.executemany("INSERT INTO projects VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       [(profile_id, i, p.get("title", ""), p.get("short_description", ""),
+                         p.get("long_description", ""), json.dumps(p.get("tech", [])), p.get("link", ""))
+                        for i, p in enumerate(profile.get("projects", []))])
+        db.executemany("INSERT INTO certifications VALUES (?, ?, ?, ?, ?)",
+                       [(profile_id, i, c.get("name", ""), c.get("issuer", ""), c.get("date", ""))
+                        for i, c in enumerate(profile.get("certifications", []))])
+        db.executemany("INSERT INTO experience VALUES (?, ?, ?, ?, ?)",
+                       [(profile_id, i, m.get("label", ""), str(start), None if end is None else str(end))
+                        for i, (m, (start, end)) in enumerate(zip(experience, map(entry_range, experience)))])
+        if commit:
+            db.commit()
+
+    def commit(self):
+        self._db.commit()
+
+    # ---- reading ----
+    def profile_ids(self):
+        return [r[0] for r in self._db.execute("SELECT id FROM profiles ORDER BY id")]
+
+    def count(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def _matrix_view(self) -> np.ndarray:
+        """Memory-mapped (rows, 4) view of the skill matrix file, remapped when it grows."""
+        size = os.path.getsize(self.matrix_path) if os.path.exists(self.matrix_path) else 0
+        rows = size // (8 * len(MATRIX_COLUMNS))
+        if rows != self._matrix_rows:
+            self._matrix = (np.memmap(self.matrix_path, dtype="<f8", mode="r", shape=(rows, len(MATRIX_COLUMNS)))
+                            if rows else np.empty((0, len(MATRIX_COLUMNS))))
+            self._matrix_rows = rows
+        return self._matrix
+
+    def skill_matrix(self, profile_id: str) -> SkillMatrix:
+        """The profile's skills as a SkillMatrix whose numeric columns are views into the memory map."""
+        with self._lock:
+            return self._skill_matrix(profile_id)
+
+    def _skill_matrix(self, profile_id: str) -> SkillMatrix:
+        row = self._db.execute("SELECT skill_offset, skill_count FROM profiles WHERE id = ?", (profile_id,)).fetchone()
+        if row is None:
+            raise KeyError(profile_id)
+        offset, count = row
+        block = self._matrix_view()[offset:offset + count]
+        names, cats = [], []
+        for name, cat in self._db.execute("SELECT name, category FROM skills WHERE profile_id = ? ORDER BY pos", (profile_id,)):
+            names.append(name)
+            cats.append(cat)
+        categories = {}
+        codes = [categories.setdefault(c, len(categories)) for c in cats]
+        return SkillMatrix(names, block[:, 0], block[:, 1], block[:, 2], block[:, 3], codes, categories)
+
+    def load(self, profile_id: str) -> dict:
+        """Load one profile in the data.py schema (plus a memory-mapped "skill_matrix")."""
+        with self._lock:
+            return self._load(profile_id)
+
+    def _load(self, profile_id: str) -> dict:
+        db = self._db
+        row = db.execute("SELECT name, headline, about, contact, resume_link, image_link FROM profiles WHERE id = ?",
+                         (profile_id,)).fetchone()
+        if row is None:
+            raise KeyError(profile_id)
+        matrix = self._skill_matrix(profile_id)
+        skills = {
+            name: {"base": float(b), "max": float(m), "k": float(k), "p": float(p), "category": cat}
+            for name, b, m, k, p, cat in zip(matrix.names, matrix.base, matrix.max, matrix.k, matrix.p, matrix.areas())
+        }
+        return {
+            "id": profile_id,
+            "name": row[0], "headline": row[1], "about": row[2], "contact": json.loads(row[3] or "{}"),
+            "resume_link": row[4], "image_link": row[5],
+            "skills": skills,
+            "skill_matrix": matrix,
+            "projects": [
+                {"title": t, "short_description": s, "long_description": l, "tech": json.loads(tech), "link": link}
+                for t, s, l, tech, link in db.execute(
+                    "SELECT title, short_description, long_description, tech, link FROM projects "
+                    "WHERE profile_id = ? ORDER BY pos", (profile_id,))
+            ],
+            "certifications": [
+                {"name": n, "issuer": i, "date": d}
+                for n, i, d in db.execute(
+                    "SELECT name, issuer, date FROM certifications WHERE profile_id = ? ORDER BY pos", (profile_id,))
+            ],
+            "experience": [
+                {"label": lb, "start": start, "end": end}
+                for lb, start, end in db.execute(
+                    "SELECT label, start, end_date FROM experience WHERE profile_id = ? ORDER BY pos", (profile_id,))
+            ],
+        }
+
+
+# -------------------------
+# Synthetic profiles and load-time measurement
+# -------------------------
+def synthetic_profile(rng: random.Random, n_skills: int = 30, n_projects: int = 10) -> dict:
+    """A random profile with the given catalogue sizes, for scale testing."""
+    categories = ("ML", "DevOps", "Tool", "ELK", "MLOps")
+    skills = {}
+    for i in range(n_skills):
+        base = rng.randint(10, 80)
+        skills[f"Skill {i:04d}"] = {"base": base, "max": rng.randint(base + 5, 100), "k": round(rng.uniform(0.3, 0.7), 2),
+                                    "p": round(rng.uniform(1.0, 1.4), 2), "category": rng.choice(categories)}
+    projects = [{"title": f"Project {i:04d}", "short_description": f"Short description of project {i}.",
+                 "long_description": f"Long description of project {i}. " * 8,
+                 "tech": rng.sample(list(skills), min(4, n_skills)), "link": ""} for i in range(n_projects)]
+    return {"name": "Synthetic", "headline": "Synthetic profile", "about": "", "contact": {},
+            "skills": skills, "projects": projects,
+            "certifications": [{"name": f"Cert {i}", "issuer": "", "date": "2024"} for i in range(3)],
+            "experience": [{"label": f"Role {i}", "start": f"{2015 + i}-{rng.randint(1, 12):02d}-01",
+                            "end": f"{2016 + i}-{rng.randint(1, 12):02d}-28"} for i in range(5)]}
+
+
+def measure_load(store: ProfileStore, samples: int = 100, seed: int = 0) -> dict:
+    """Per-profile load time over random profile ids, in milliseconds."""
+    ids = store.profile_ids()
+    rng = random.Random(seed)
+    times = []
+    for _ in range(min(samples, len(ids)) if ids else 0):
+        pid = rng.choice(ids)
+        t0 = time.perf_counter()
+        store.load(pid)
+        times.append((time.perf_counter() - t0) * 1000)
+    times.sort()
+    pick = lambda q: round(times[min(len(times) - 1, int(q * len(times)))], 3) if times else None
+    return {"profiles": len(ids), "samples": len(times), "p50_ms": pick(0.5), "p95_ms": pick(0.95), "max_ms": pick(1.0)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the on-disk portfolio profile store.")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_imp = sub.add_parser("import", help="import a data module (app.py / data.py) as one profile")
+    p_imp.add_argument("root")
+    p_imp.add_argument("module")
+    p_imp.add_argument("--id", required=True)
+    p_syn = sub.add_parser("synth", help="add synthetic profiles for scale testing")
+    p_syn.add_argument("root")
+    p_syn.add_argument("count", type=int)
+    p_syn.add_argument("--skills", type=int, default=30)
+    p_syn.add_argument("--projects", type=int, default=10)
+    p_syn.add_argument("--seed", type=int, default=0)
+    p_bench = sub.add_parser("bench", help="measure per-profile load time")
+    p_bench.add_argument("root")
+    p_bench.add_argument("--samples", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    store = ProfileStore(args.root)
+    if args.cmd == "import":
+        store.write_profile(args.id, profile_from_module(read_data_module(args.module)))
+        print(f"imported {args.module} as {args.id!r}")
+    elif args.cmd == "synth":
+        rng = random.Random(args.seed)
+        start = store.count()
+        for i in range(args.count):
+            store.write_profile(f"synthetic-{start + i:07d}", synthetic_profile(rng, args.skills, args.projects), commit=False)
+        store.commit()
+        print(f"added {args.count} synthetic profiles ({store.count()} total)")
+    else:
+        print(json.dumps(measure_load(store, args.samples)))
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
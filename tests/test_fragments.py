@@ -0,0 +1,29 @@
+import pytest
+
+from fragments import PageFragments, certifications_grid
+
+CERTS = [{"name": "MySQL", "issuer": "", "date": "2023"},
+         {"name": "Google Data Analytics", "issuer": "Google / Coursera", "date": "2023"}]
+
+
+def markdown_safe(fragment: str) -> bool:
+    """No line that would end a CommonMark HTML block (blank) or start a code block (indented)."""
+    return all(line.strip() and not line.startswith("    ") for line in fragment.splitlines())
+
+
+def test_certifications_grid_with_empty_issuer_stays_one_html_block():
+    grid = certifications_grid(CERTS)
+    assert markdown_safe(grid)
+    assert "Google / Coursera" in grid and grid.count(">2023</p>") == 2
+
+
+def test_every_fragment_is_markdown_safe_with_empty_and_multiline_values():
+    page = PageFragments("line one\n\n    line two", "", [{"title": "", "tech": [], "short_description": ""}], [])
+    assert all(markdown_safe(f) for f in (page.about, page.certifications, *page.projects))
+    assert "line one line two" in page.about
+
+
+def test_certifications_grid_renders_dates_as_html():
+    markdown_it = pytest.importorskip("markdown_it")
+    rendered = markdown_it.MarkdownIt("commonmark").render(certifications_grid(CERTS))
+    assert "<pre>" not in rendered and ">2023</p>" in rendered
@@ -0,0 +1,68 @@
+import itertools
+import json
+import os
+
+import numpy as np
+import pytest
+
+from core import predict_timeline_heuristic, skill_area, skill_level
+from rules import RULES_PATH, default_engine
+
+
+def if_chain(skills, n_projects, years):
+    """The hand-written milestone logic the rule table replaced."""
+    def score(area):
+        levels = [skill_level(m) for m in skills.values() if skill_area(m) == area]
+        return float(np.mean(levels)) if levels else 0
+    ml, devops = score("ML"), score("DevOps")
+    elk = skill_level(skills.get("Elasticsearch", {}))
+    year1 = ("Consolidate ML fundamentals, complete 1–2 production-oriented projects, document reproducible pipelines."
+             if years < 1 else "Solidify ML fundamentals; show production-oriented notebook / dockerized demo.")
+    year3 = ("Move to ML Engineer/Data Scientist: productionized models, containerized pipelines, basic CI/CD & monitoring."
+             if ml >= 60 and devops >= 40 else
+             "Aim for ML Engineer/Data Scientist: focus on productionization, containerization, and end-to-end pipelines.")
+    if elk < 40:
+        year3 += " (ELK is beginner — add observability and monitoring skills)."
+    year5 = ("MLOps Lead: architect ML systems, mentor teams, lead deployments and reliability."
+             if devops >= 60 and n_projects >= 4 else
+             "Senior ML role / path to MLOps Lead: strengthen DevOps & observability skills, lead cross-functional projects.")
+    return {1: year1, 3: year3, 5: year5}
+
+
+def profiles():
+    for ml, devops, elk, n_projects, years in itertools.product(
+            (None, 59, 60), (None, 39, 40, 60), (None, 39, 40), (3, 4), (0.5, 1.0, 3)):
+        skills = {}
+        if ml is not None:
+            skills.update({"Python": {"level": ml + 10, "area": "ML"}, "PyTorch": {"level": ml - 10, "area": "ML"}})
+        if devops is not None:
+            skills["Docker"] = {"base": devops, "category": "DevOps"}
+        if elk is not None:
+            skills["Elasticsearch"] = {"level": elk, "area": "Search"}
+        yield skills, n_projects, years
+
+
+@pytest.mark.parametrize("skills,n_projects,years", list(profiles()))
+def test_heuristic_matches_if_chain(skills, n_projects, years):
+    assert predict_timeline_heuristic(skills, n_projects, years) == if_chain(skills, n_projects, years)
+
+
+def test_batched_evaluation_matches_if_chain():
+    cases = list(profiles())
+    got = default_engine().evaluate_profiles([{"skills": s, "n_projects": n} for s, n, _ in cases],
+                                             [y for _, _, y in cases])
+    assert got == [if_chain(*case) for case in cases]
+
+
+def test_default_engine_recompiles_with_a_new_version_when_rules_change(tmp_path):
+    path = tmp_path / "rules.json"
+    with open(RULES_PATH, encoding="utf-8") as fh:
+        table = json.load(fh)
+    path.write_text(json.dumps(table))
+    old = default_engine(str(path))
+    table["milestones"]["1"]["cases"][-1]["text"] = "Edited."
+    path.write_text(json.dumps(table))
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+    new = default_engine(str(path))
+    assert new.version != old.version
+    assert predict_timeline_heuristic({}, 1, 2.0, new)[1] == "Edited."
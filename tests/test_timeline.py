@@ -0,0 +1,44 @@
+import numpy as np
+
+from timeline import DAYS_PER_YEAR, cumulative_years, merge_intervals, to_intervals
+
+
+def days(*values):
+    return np.array(values, dtype="datetime64[D]")
+
+
+def test_merge_intervals_joins_overlapping_and_touching_ranges():
+    starts = days("2021-01-01", "2020-01-01", "2020-06-01", "2022-01-01")
+    ends = days("2021-03-31", "2020-12-31", "2020-08-01", "2022-02-01")
+    s, e = merge_intervals(starts, ends)
+    assert s.tolist() == days("2020-01-01", "2022-01-01").tolist()
+    assert e.tolist() == days("2021-03-31", "2022-02-01").tolist()
+
+
+def test_cumulative_years_does_not_double_count_overlaps():
+    s, e = merge_intervals(days("2020-01-01", "2020-01-01"), days("2020-12-31", "2020-06-30"))
+    years = cumulative_years(s, e, days("2019-12-31", "2020-01-10", "2023-01-01"))
+    assert years.tolist() == [0.0, 10 / DAYS_PER_YEAR, 366 / DAYS_PER_YEAR]
+
+
+def test_inverted_and_future_entries_count_as_zero():
+    entries = [{"start": "2020-05-01", "end": "2020-01-01"}, {"start": "2030-01-01", "end": None}]
+    s, e = merge_intervals(*to_intervals(entries, as_of="2024-01-01"))
+    assert cumulative_years(s, e, days("2024-01-01")).tolist() == [0.0]
+
+
+def test_store_keeps_entered_dates_and_clips_on_read(tmp_path):
+    from store import ProfileStore
+
+    entries = [{"label": "Future", "start": "2026-01-01", "end": "2027-06-30"},
+               {"label": "Inverted", "start": "2020-05-01", "end": "2020-01-01"},
+               {"label": "Now", "start": "2025-01-01", "end": None},
+               {"label": "Legacy", "exp": 1.0, "date": "2019-12"}]
+    store = ProfileStore(str(tmp_path))
+    store.write_profile("p", {"skills": {"A": {"level": 50, "area": "ML"}}, "experience": entries})
+    stored = store.load("p")["experience"]
+    assert [(e["start"], e["end"]) for e in stored[:3]] == [
+        ("2026-01-01", "2027-06-30"), ("2020-05-01", "2020-01-01"), ("2025-01-01", None)]
+    assert stored[3]["end"] == "2019-12-31"
+    s, e = to_intervals(stored, as_of="2026-07-01")
+    assert e.tolist() == days("2026-07-01", "2020-04-30", "2026-07-01", "2019-12-31").tolist()
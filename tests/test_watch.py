@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+from cache import PortfolioCache, ProjectionGrid
+from model import PortfolioModel
+from search import ProjectIndex
+from watch import DataWatcher, ModuleSource, diff_models
+
+PROFILE = """
+NAME = "Test"
+SKILLS = {SKILLS}
+PROJECTS = [{{"title": "{TITLE}", "short_description": "demo", "tech": ["Python"]}},
+            {{"title": "Other", "short_description": "second", "tech": ["SQL"]}}]
+EXPERIENCE = [{{"label": "Job", "start": "2020-01-01", "end": "2021-01-01"}}]
+"""
+SKILLS = '{"A": {"level": 10, "area": "ML"}, "B": {"level": 90, "area": "ML"}}'
+SWAPPED = '{"B": {"level": 90, "area": "ML"}, "A": {"level": 10, "area": "ML"}}'
+
+
+def model(skills=SKILLS, title="First"):
+    from model import profile_from_module
+
+    values = {}
+    exec(PROFILE.format(SKILLS=skills, TITLE=title), {}, values)
+    return PortfolioModel.from_profile(profile_from_module(values))
+
+
+def test_diff_models_reports_changed_entries():
+    diff = diff_models(model(), model(title="Renamed"))
+    assert diff.groups == {"projects"} and diff.projects == {0}
+    assert diff_models(model(), model()).empty
+
+
+def test_derive_matches_fresh_build_after_reorder_and_unrelated_change():
+    old, new = model(), model(SWAPPED, title="Renamed")
+    cache = PortfolioCache(old.version, old.skill_matrix)
+    cache.get("timeline", (1.0,), lambda: "timeline")
+    cache.get("bar", (1.0, 2), lambda: "bar")
+    cache.get("project_index", (), lambda: ProjectIndex(old.projects))
+    diff = diff_models(old, new)
+    derived = cache.derive(new.version, new.skill_matrix, diff,
+                           {"project_index": lambda index: index.updated(new.projects, diff.projects)})
+    fresh = ProjectionGrid(new.skill_matrix)
+    assert derived.grid.top(3.0) == fresh.top(3.0)
+    assert np.array_equal(derived.grid.values, fresh.values)
+    assert derived.get("timeline", (1.0,), lambda: "rebuilt") == "timeline"
+    assert derived.get("bar", (1.0, 2), lambda: "rebuilt") == "rebuilt"
+    index = derived.get("project_index", (), lambda: None)
+    assert index.postings == ProjectIndex(new.projects).postings
+
+
+def test_watcher_keeps_last_good_data_on_malformed_edit(tmp_path):
+    path = tmp_path / "data.py"
+    path.write_text(PROFILE.format(SKILLS=SKILLS, TITLE="First"))
+    watcher, source = DataWatcher(interval=0), ModuleSource(str(path))
+    good = watcher.watch(source)
+    path.write_text(PROFILE.format(SKILLS='{"A": 90}', TITLE="First") + "\n")
+    assert watcher.poll()[0]["error"].startswith("TypeError")
+    assert watcher.current(source) is good
+
+
+def test_module_source_loads_without_numpy():
+    probe = ("import sys; from watch import DataWatcher, ModuleSource; "
+             "DataWatcher().current(ModuleSource('app.py')); print('numpy' in sys.modules)")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, "-c", probe], cwd=root, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_stale_model_gets_its_own_versions_cache_after_reload(tmp_path):
+    path = tmp_path / "data.py"
+    path.write_text(PROFILE.format(SKILLS=SKILLS, TITLE="First"))
+    watcher, source = DataWatcher(interval=0), ModuleSource(str(path))
+    stale = watcher.watch(source)
+    watcher.cache(source, stale).get("project_index", (), lambda: ProjectIndex(stale.projects))
+    path.write_text(PROFILE.format(SKILLS=SKILLS, TITLE="First")
+                    + 'PROJECTS = [{"title": "A"}, {"title": "B"}, {"title": "C"}]\n')
+    assert watcher.poll()[0]["version"] != stale.version
+    fresh = watcher.current(source)
+    assert len(fresh.projects) == 3 and watcher.cache(source).version == fresh.version
+    # a fragment rerun of the first session still holds `stale`
+    old = watcher.cache(source, stale)
+    assert old.version == stale.version
+    assert old.get("project_index", (), lambda: ProjectIndex(stale.projects)).size == 2
+    assert watcher.cache(source, fresh).get("project_index", (), lambda: None).size == 3
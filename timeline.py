@@ -0,0 +1,108 @@
+# timeline.py
+# Interval-based experience timeline. Roles are real [start, end] date ranges;
+# overlapping engagements are merged with a sort-and-sweep so concurrent
+# contracts are not double counted, and cumulative experience is evaluated on
+# a month/quarter date grid from a cumsum of the merged interval lengths.
+
+import numpy as np
+
+DAYS_PER_YEAR = 365.25
+FREQUENCIES = {"month": "ME", "quarter": "QE"}
+
+
+def _day(value):
+    return np.datetime64(value, "D")
+
+
+def entry_range(entry) -> tuple:
+    """
+    (start, end) of one experience entry as entered, end None while ongoing.
+    Legacy entries with "exp" years ending at "date" (YYYY-MM) become the range
+    of that length ending at the end of that month. Nothing is clipped here.
+    """
+    if "start" in entry:
+        return _day(entry["start"]), _day(entry["end"]) if entry.get("end") else None
+    end = (np.datetime64(entry["date"], "M") + 1).astype("datetime64[D]") - 1
+    return end - int(round(float(entry.get("exp", 0.0)) * DAYS_PER_YEAR)), end
+
+
+def to_intervals(entries, as_of=None):
+    """
+    (starts, ends) datetime64[D] arrays from experience entries (see
+    entry_range); ongoing entries are measured to `as_of`, default today.
+    An entry that ends before it starts, or starts after `as_of`, counts as
+    zero days rather than a negative length.
+    """
+    as_of = _day(as_of) if as_of is not None else np.datetime64("today", "D")
+    starts, ends = [], []
+    for e in entries:
+        start, end = entry_range(e)
+        end = as_of if end is None else end
+        starts.append(start)
+        ends.append(max(min(end, as_of), start - 1))  # [start, start - 1] is empty
+    return np.array(starts, dtype="datetime64[D]"), np.array(ends, dtype="datetime64[D]")
+
+
+def merge_intervals(starts, ends):
+    """Union of possibly overlapping or touching [start, end] ranges, sorted by start."""
+    if len(starts) == 0:
+        return starts, ends
+    order = np.argsort(starts, kind="stable")
+    s, e = starts[order], ends[order]
+    reach = np.maximum.accumulate(e)
+    # a new block starts wherever a start lies beyond everything seen so far (+1 day: touching ranges merge)
+    new_block = np.concatenate([[True], s[1:] > reach[:-1] + 1])
+    last = np.concatenate([np.flatnonzero(new_block)[1:] - 1, [len(s) - 1]])
+    return s[new_block], reach[last]
+
+
+def cumulative_years(starts, ends, dates):
+    """Cumulative experience in years at each of `dates`, from merged intervals."""
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    if len(starts) == 0:
+        return np.zeros(len(dates))
+    length = (ends - starts).astype(np.int64) + 1
+    done_before = np.concatenate([[0], np.cumsum(length)[:-1]])
+    i = np.searchsorted(starts, dates, side="right") - 1
+    valid = i >= 0
+    j = np.where(valid, i, 0)
+    partial = np.clip((dates - starts[j]).astype(np.int64) + 1, 0, length[j])
+    return np.where(valid, done_before[j] + partial, 0) / DAYS_PER_YEAR
+
+
+def experience_series(entries, freq: str = "month", as_of=None):
+    """
+    Date-indexed cumulative experience (pandas Series, years) sampled at each
+    month or quarter end from the first start up to `as_of`, whose value is the
+    final point.
+    """
+    import pandas as pd
+
+    starts, ends = merge_intervals(*to_intervals(entries, as_of))
+    as_of = _day(as_of) if as_of is not None else np.datetime64("today", "D")
+    if len(starts) == 0:
+        return pd.Series([], dtype=float, index=pd.DatetimeIndex([]))
+    grid = pd.date_range(pd.Timestamp(starts[0]), pd.Timestamp(as_of), freq=FREQUENCIES[freq])
+    dates = grid.values.astype("datetime64[D]")
+    if len(dates) == 0 or dates[-1] != as_of:
+        dates = np.append(dates, as_of)
+    return pd.Series(cumulative_years(starts, ends, dates), index=pd.DatetimeIndex(dates))
+
+
+def project_forward(series, years: float, freq: str = "month"):
+    """
+    Continue a cumulative series at one year per year until it reaches `years`
+    of total experience. Returns an empty series when `years` is already reached.
+    """
+    import pandas as pd
+
+    current = float(series.iloc[-1]) if len(series) else 0.0
+    if years <= current:
+        return pd.Series([], dtype=float, index=pd.DatetimeIndex([]))
+    start = series.index[-1] if len(series) else pd.Timestamp.today().normalize()
+    target = start + pd.Timedelta(days=(years - current) * DAYS_PER_YEAR)
+    grid = pd.date_range(start, target, freq=FREQUENCIES[freq])
+    dates = grid.append(pd.DatetimeIndex([target])) if len(grid) == 0 or grid[-1] != target else grid
+    dates = pd.DatetimeIndex([start]).append(dates[dates > start])
+    elapsed = np.asarray((dates - start) / pd.Timedelta(days=DAYS_PER_YEAR), dtype=np.float64)
+    return pd.Series(current + elapsed, index=dates)
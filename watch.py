@@ -0,0 +1,296 @@
+# watch.py
+# Watch-and-reload of the portfolio data. A DataWatcher polls its sources - a
+# data module such as app.py or data.py (read with model.read_data_module, so
+# nothing is executed) or one profile of a store.py directory - and when a
+# source's files change it rebuilds that source's PortfolioModel, diffs the
+# records against the previous model and derives the next PortfolioCache from
+# the previous one. Only the artifacts built from changed entries are dropped:
+# a changed skill re-projects just its grid column, a changed project
+# re-tokenizes just its search index entry, and fragments.py's content-hash
+# cache re-renders just the changed cards. Everything else stays warm for every
+# session, and no process reload is needed.
+#
+#   python watch.py app.py                      # print record diffs as the file is edited
+#   python watch.py data.py --interval 0.5
+#   python watch.py --store profiles/ dhrubo
+
+import argparse
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+
+from model import PortfolioModel, profile_from_module, read_data_module
+
+SCALAR_FIELDS = ("name", "headline", "about", "contact", "resume_link", "image_link")
+POLL_INTERVAL = float(os.environ.get("PORTFOLIO_WATCH_INTERVAL", "1.0"))
+# caches kept per source: the current version's plus older ones still used by
+# sessions whose fragment reruns hold the model of an earlier full run
+CACHE_VERSIONS = 3
+
+
+# -------------------------
+# Record diffs
+# -------------------------
+class ModelDiff:
+    """What changed between two PortfolioModels; `groups` names the changed parts of the profile."""
+
+    __slots__ = ("fields", "skills", "projects", "certifications", "experience")
+
+    def __init__(self, fields=(), skills=(), projects=(), certifications=(), experience=False):
+        self.fields = frozenset(fields)                  # changed scalar fields (SCALAR_FIELDS)
+        self.skills = frozenset(skills)                  # names of changed, added or removed skills
+        self.projects = frozenset(projects)              # positions of changed, added or removed projects
+        self.certifications = frozenset(certifications)  # positions, as for projects
+        self.experience = experience
+
+    @property
+    def groups(self) -> set:
+        groups = set()
+        if self.fields:
+            groups.add("profile")
+        for name in ("skills", "projects", "certifications", "experience"):
+            if getattr(self, name):
+                groups.add(name)
+        return groups
+
+    @property
+    def empty(self) -> bool:
+        return not self.groups
+
+    def summary(self) -> dict:
+        return {"fields": sorted(self.fields), "skills": sorted(self.skills), "projects": sorted(self.projects),
+                "certifications": sorted(self.certifications), "experience": self.experience}
+
+
+def _changed_positions(old, new) -> set:
+    changed = {i for i, (a, b) in enumerate(zip(old, new)) if a.as_dict() != b.as_dict()}
+    return changed | set(range(min(len(old), len(new)), max(len(old), len(new))))
+
+
+def diff_models(old: PortfolioModel, new: PortfolioModel) -> ModelDiff:
+    """Record-level diff: skills by name (a moved skill counts as changed), projects and certifications by position."""
+    skills = {name for name in old.skills.keys() | new.skills.keys()
+              if name not in old.skills or name not in new.skills
+              or old.skills[name].as_dict() != new.skills[name].as_dict()}
+    # skill order breaks ties in the top-N ranking, so reordered skills invalidate the ranked artifacts
+    skills.update(a for a, b in zip(old.skills, new.skills) if a != b)
+    return ModelDiff(
+        fields=[f for f in SCALAR_FIELDS if getattr(old, f) != getattr(new, f)],
+        skills=skills,
+        projects=_changed_positions(old.projects, new.projects),
+        certifications=_changed_positions(old.certifications, new.certifications),
+        experience=[r.as_dict() for r in old.experience] != [r.as_dict() for r in new.experience],
+    )
+
+
+def derive_cache(cache, model: PortfolioModel, diff: ModelDiff):
+    """The next version's PortfolioCache from the previous one, patching the project search index in place."""
+    updaters = {"project_index": lambda index: index.updated(model.projects, diff.projects)}
+    return cache.derive(model.version, model.skill_matrix, diff, updaters)
+
+
+# -------------------------
+# Sources
+# -------------------------
+def _stamp(*paths) -> tuple:
+    """(mtime_ns, size) of each path, None for missing ones."""
+    out = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            out.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            out.append(None)
+    return tuple(out)
+
+
+class ModuleSource:
+    """The literal profile data of a Python data module (app.py / data.py schema)."""
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self.key = ("module", self.path)
+
+    def stamp(self) -> tuple:
+        return _stamp(self.path)
+
+    def load(self) -> dict:
+        return profile_from_module(read_data_module(self.path))
+
+
+class StoreSource:
+    """One profile of a store.py directory; a write to the store's files triggers a reload."""
+
+    _stores = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(self, root: str, profile_id: str):
+        self.root = os.path.abspath(root)
+        self.profile_id = profile_id
+        self.key = ("store", self.root, profile_id)
+
+    def stamp(self) -> tuple:
+        from store import DB_NAME, MATRIX_NAME
+        db = os.path.join(self.root, DB_NAME)
+        return _stamp(db, db + "-wal", os.path.join(self.root, MATRIX_NAME))
+
+    def load(self) -> dict:
+        from store import ProfileStore
+        with self._stores_lock:
+            store = self._stores.get(self.root)
+            if store is None:
+                store = self._stores[self.root] = ProfileStore(self.root)
+        return store.load(self.profile_id)
+
+
+# -------------------------
+# Watcher
+# -------------------------
+class _Entry:
+    __slots__ = ("stamp", "checked", "model", "caches")
+
+    def __init__(self, stamp, model):
+        self.stamp = stamp
+        self.checked = time.monotonic()
+        self.model = model
+        self.caches = OrderedDict()  # data version -> PortfolioCache, oldest first
+
+    def keep(self, version: str, cache):
+        """Store `cache` for `version`, dropping the oldest caches other than the current version's."""
+        self.caches[version] = cache
+        for old in list(self.caches):
+            if len(self.caches) <= CACHE_VERSIONS:
+                break
+            if old != self.model.version:
+                del self.caches[old]
+        return cache
+
+
+class DataWatcher:
+    """
+    Latest PortfolioModel and PortfolioCache of each source, reloaded when the
+    source's files change. current() stats the files at most once per
+    `interval` seconds, so a rerun costs one os.stat; poll() checks every
+    watched source now.
+    """
+
+    def __init__(self, interval: float = POLL_INTERVAL, max_sources: int = 64, history: int = 20):
+        self.interval = interval
+        self.max_sources = max_sources
+        self.events = deque(maxlen=history)  # recent reloads, newest last
+        self._entries = OrderedDict()
+        self._sources = []
+        self._lock = threading.RLock()
+
+    def current(self, source) -> PortfolioModel:
+        """The source's model, reloaded first if its files changed since the last check."""
+        with self._lock:
+            entry = self._entries.get(source.key)
+            if entry is None:
+                entry = self._entries[source.key] = _Entry(source.stamp(), PortfolioModel.from_profile(source.load()))
+                while len(self._entries) > self.max_sources:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(source.key)
+                if time.monotonic() - entry.checked >= self.interval:
+                    self._refresh(source, entry)
+            return entry.model
+
+    def cache(self, source, model: PortfolioModel = None):
+        """
+        The PortfolioCache of `model`, a model of the source (default the
+        current one, without checking the files again), built on first use.
+        A caller still holding an older model gets that version's cache, never
+        the cache of a newer version another caller's reload installed.
+        """
+        from cache import PortfolioCache
+
+        with self._lock:
+            entry = self._entries.get(source.key)
+            if entry is None:
+                self.current(source)
+                entry = self._entries[source.key]
+            model = model or entry.model
+            cache = entry.caches.get(model.version)
+            if cache is None:
+                cache = entry.keep(model.version, PortfolioCache(model.version, model.skill_matrix))
+            return cache
+
+    def _refresh(self, source, entry: _Entry):
+        """Reload `entry` if the source's files changed; returns the reload event, if any."""
+        entry.checked = time.monotonic()
+        stamp = source.stamp()
+        if stamp == entry.stamp:
+            return None
+        started = time.perf_counter()
+        try:
+            model = PortfolioModel.from_profile(source.load())
+        except Exception as exc:
+            # a half-saved or broken edit: keep serving the last good data and look again next time
+            event = {"source": source.key, "error": f"{type(exc).__name__}: {exc}"}
+            self.events.append(event)
+            return event
+        entry.stamp = stamp
+        if model.version == entry.model.version:
+            return None
+        diff = diff_models(entry.model, model)
+        previous = entry.caches.get(entry.model.version)
+        entry.model = model
+        cache = entry.keep(model.version, derive_cache(previous, model, diff)) if previous is not None else None
+        event = {
+            "source": source.key, "version": model.version, "changed": diff.summary(),
+            "artifacts": dict(cache.inherited) if cache is not None else None,
+            "ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+        self.events.append(event)
+        return event
+
+    def poll(self) -> list:
+        """Check every watched source now; returns the events of the reloads this caused."""
+        events = []
+        with self._lock:
+            for source in self._sources:
+                entry = self._entries.get(source.key)
+                if entry is None:
+                    self.current(source)
+                else:
+                    event = self._refresh(source, entry)
+                    if event:
+                        events.append(event)
+        return events
+
+    def watch(self, source):
+        """Register `source` for poll() and load it."""
+        with self._lock:
+            if source.key not in {s.key for s in self._sources}:
+                self._sources.append(source)
+        return self.current(source)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Watch portfolio data and print record diffs on change.")
+    parser.add_argument("module", nargs="?", help="data module to watch (app.py / data.py)")
+    parser.add_argument("--store", nargs=2, metavar=("ROOT", "PROFILE"), help="watch one stored profile instead")
+    parser.add_argument("--interval", type=float, default=POLL_INTERVAL)
+    args = parser.parse_args(argv)
+    if not args.module and not args.store:
+        parser.error("give a data module or --store ROOT PROFILE")
+
+    source = StoreSource(*args.store) if args.store else ModuleSource(args.module)
+    watcher = DataWatcher(args.interval)
+    model = watcher.watch(source)
+    watcher.cache(source)
+    print(f"watching {source.key[1]} (version {model.version}); Ctrl-C to stop", file=sys.stderr)
+    try:
+        while True:
+            time.sleep(args.interval)
+            for event in watcher.poll():
+                print(event, flush=True)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()